@@ -2,27 +2,43 @@
 Pydantic AI agent factory with OpenRouter integration.
 Implements agent creation, streaming, and tool calling.
 """
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any, Optional, AsyncIterator
-from pydantic import BaseModel
+import asyncio
+import hashlib
+from pydantic import BaseModel, Field, TypeAdapter
 from pydantic_ai import Agent, RunContext
 from pydantic_ai.models.openrouter import OpenRouterModel
-from openrouter_agent import OpenRouterAgent
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import (
+    RetryCallState,
+    retry,
+    stop_after_attempt,
+    wait_random_exponential,
+    retry_if_exception_type,
+)
 from database import settings
+from http_client import get_openrouter_client
+import llm_cache
 import tools
-import research_tools
-from research_schemas import CitationFormat
 
 
 class AgentDependencies(BaseModel):
     """
     Dependencies injected into agent context.
-    External resources like HTTP clients or exchange connections.
+    External resources like HTTP clients or exchange connections,
+    plus state shared between delegating agents.
     """
     http_client: Optional[httpx.AsyncClient] = None
     trading_ctx: Optional[tools.TradingContext] = None
     exchange: Optional[Any] = None  # ccxt.Exchange
+    shared_context: dict[str, Any] = Field(default_factory=dict)
+
+
+# Shared empty dependencies; model_construct skips validation of all-default fields.
+# Treat as read-only: build a new instance when a run needs its own state.
+_EMPTY_DEPS = AgentDependencies.model_construct()
 
 
 class AgentOutput(BaseModel):
@@ -35,6 +51,45 @@ class AgentOutput(BaseModel):
     tool_calls: list[dict[str, Any]] = []
 
 
+# One model wrapper per OpenRouter model ID, all sharing the pooled HTTP client
+_MODEL_CACHE: dict[str, OpenRouterModel] = {}
+# Client the cached models (and agents built on them) were created with
+_model_client: Optional[httpx.AsyncClient] = None
+
+
+def _current_client() -> httpx.AsyncClient:
+    """
+    Return the shared HTTP client, dropping models and agents built on an older one.
+
+    close_openrouter_client() (shutdown, test lifespans) leaves the next
+    call with a new client; cached models would still hold the closed one.
+    """
+    global _model_client
+    client = get_openrouter_client()
+    if client is not _model_client:
+        _MODEL_CACHE.clear()
+        _agent_cache.clear()
+        _agent_cache_keys.clear()
+        _model_client = client
+    return client
+
+
+def _get_model(model_id: str) -> OpenRouterModel:
+    """Return the shared OpenRouterModel for a model ID, creating it on first use."""
+    client = _current_client()
+    model = _MODEL_CACHE.get(model_id)
+    if model is None:
+        model = _MODEL_CACHE.setdefault(
+            model_id,
+            OpenRouterModel(
+                model_id=model_id,
+                api_key=settings.openrouter_api_key,
+                http_client=client
+            )
+        )
+    return model
+
+
 def create_agent(
     system_prompt: str,
     model_id: str,
@@ -65,20 +120,17 @@ def create_agent(
             has_research_tools=True
         )
     """
-    # Initialize OpenRouter model
-    model = OpenRouterModel(
-        model_id=model_id,
-        api_key=settings.openrouter_api_key,
-        http_client=httpx.AsyncClient(timeout=60.0)
-    )
+    # Reuse the OpenRouter model wrapper for this model ID
+    model = _get_model(model_id)
 
     # Create agent with dependencies type
     agent = Agent(
         model=model,
         system_prompt=system_prompt,
         deps_type=AgentDependencies,
-        result_type=AgentOutput,
-        retries=max_retries
+        output_type=AgentOutput,
+        retries=max_retries,
+        model_settings={"temperature": temperature}
     )
 
     # Register trading tools if enabled
@@ -92,6 +144,70 @@ def create_agent(
     return agent
 
 
+# LRU of compiled agents keyed by blueprint configuration
+_AGENT_CACHE_MAXSIZE = 256
+_agent_cache: "OrderedDict[tuple, Agent[AgentDependencies, AgentOutput]]" = OrderedDict()
+_agent_cache_keys: dict[int, tuple] = {}  # blueprint_id -> cache key
+
+
+def get_or_build_agent(
+    blueprint_id: int,
+    system_prompt: str,
+    model_id: str,
+    temperature: float = 0.7,
+    max_retries: int = 0,
+    has_trading_tools: bool = False
+) -> Agent[AgentDependencies, AgentOutput]:
+    """
+    Return a cached agent for a blueprint configuration, building it on a miss.
+
+    Agents are keyed by (model_id, system prompt hash, temperature,
+    max_retries, has_trading_tools), so repeated delegations to the same
+    blueprint skip model, schema and tool registration work.
+
+    Note: callers must not mutate the returned agent (e.g. by adding tools).
+
+    Args:
+        blueprint_id: AgentBlueprint ID, used for targeted invalidation
+        system_prompt: Instructions defining agent behavior
+        model_id: OpenRouter model identifier
+        temperature: Sampling temperature (0.0-2.0)
+        max_retries: Retry attempts (0 for fallback pattern)
+        has_trading_tools: Whether to enable CCXT trading tools
+
+    Returns:
+        Shared Agent instance
+    """
+    _current_client()  # Drops agents built on a closed HTTP client
+    sp_hash = hashlib.blake2b(system_prompt.encode(), digest_size=16).hexdigest()
+    key = (model_id, sp_hash, temperature, max_retries, has_trading_tools)
+
+    agent = _agent_cache.get(key)
+    if agent is not None:
+        _agent_cache.move_to_end(key)
+    else:
+        agent = create_agent(
+            system_prompt=system_prompt,
+            model_id=model_id,
+            temperature=temperature,
+            max_retries=max_retries,
+            has_trading_tools=has_trading_tools
+        )
+        _agent_cache[key] = agent
+        if len(_agent_cache) > _AGENT_CACHE_MAXSIZE:
+            _agent_cache.popitem(last=False)
+
+    _agent_cache_keys[blueprint_id] = key
+    return agent
+
+
+def invalidate_agent_cache(blueprint_id: int) -> None:
+    """Drop the cached agent for a blueprint. Called on blueprint update/delete."""
+    key = _agent_cache_keys.pop(blueprint_id, None)
+    if key is not None:
+        _agent_cache.pop(key, None)
+
+
 def register_trading_tools(agent: Agent) -> None:
     """
     Register CCXT trading tools with the agent.
@@ -138,12 +254,25 @@ def register_trading_tools(agent: Agent) -> None:
         return await tools.get_account_balance(ctx.deps.exchange)
 
 
+@lru_cache(maxsize=1)
+def _paper_list_adapter() -> TypeAdapter:
+    """Adapter that serializes a list of papers in one pass."""
+    from research_schemas import PaperResult
+
+    return TypeAdapter(list[PaperResult])
+
+
 def register_research_tools(agent: Agent) -> None:
     """
     Register research assistant tools with the agent.
 
     Provides academic search (ArXiv, PubMed), web scraping, and citation formatting.
+    Research modules are imported here so agents without research tools
+    never load them.
     """
+    import research_tools
+
+    paper_list_adapter = _paper_list_adapter()
 
     @agent.tool
     async def search_arxiv_papers(
@@ -161,10 +290,10 @@ def register_research_tools(agent: Agent) -> None:
         Returns:
             List of papers with title, authors, abstract, url, etc.
         """
-        http_client = ctx.deps.http_client or httpx.AsyncClient(timeout=30.0)
+        http_client = ctx.deps.http_client or get_openrouter_client()
         results = await research_tools.search_arxiv(query, max_results, http_client)
         # Convert PaperResult objects to dicts for JSON serialization
-        return [paper.model_dump() for paper in results]
+        return paper_list_adapter.dump_python(results)
 
     @agent.tool
     async def search_pubmed_papers(
@@ -182,9 +311,9 @@ def register_research_tools(agent: Agent) -> None:
         Returns:
             List of papers with title, authors, abstract, url, etc.
         """
-        http_client = ctx.deps.http_client or httpx.AsyncClient(timeout=30.0)
+        http_client = ctx.deps.http_client or get_openrouter_client()
         results = await research_tools.search_pubmed(query, max_results, http_client)
-        return [paper.model_dump() for paper in results]
+        return paper_list_adapter.dump_python(results)
 
     @agent.tool
     async def scrape_webpage_content(
@@ -202,7 +331,7 @@ def register_research_tools(agent: Agent) -> None:
         Returns:
             Dict with title, content, links, and metadata
         """
-        http_client = ctx.deps.http_client or httpx.AsyncClient(timeout=30.0)
+        http_client = ctx.deps.http_client or get_openrouter_client()
         result = await research_tools.scrape_webpage(url, selector, False, http_client)
         return result.model_dump()
 
@@ -232,10 +361,10 @@ def register_research_tools(agent: Agent) -> None:
         Returns:
             Formatted citation string
         """
-        from research_schemas import PaperResult, PaperSource
+        from research_schemas import CitationFormat, PaperResult, PaperSource
 
-        # Create PaperResult from parameters
-        paper = PaperResult(
+        # Build PaperResult without validation; formatters only read these fields
+        paper = PaperResult.model_construct(
             title=title,
             authors=authors,
             url=url,
@@ -247,22 +376,63 @@ def register_research_tools(agent: Agent) -> None:
             pdf_url=None
         )
 
-        # Map string format to enum
-        format_map = {
-            "bibtex": CitationFormat.BIBTEX,
-            "apa": CitationFormat.APA,
-            "mla": CitationFormat.MLA,
-            "chicago": CitationFormat.CHICAGO
-        }
-        citation_format = format_map.get(format.lower(), CitationFormat.BIBTEX)
+        # Map string format to enum (values match the format names)
+        try:
+            citation_format = CitationFormat(format.lower())
+        except ValueError:
+            citation_format = CitationFormat.BIBTEX
 
         return research_tools.format_citation(paper, citation_format)
 
 
+# Caps concurrent OpenRouter calls so bursts queue client-side instead of 429ing
+_OPENROUTER_SEM = asyncio.Semaphore(settings.openrouter_max_inflight)
+
+_jittered_backoff = wait_random_exponential(multiplier=0.1, max=16)
+
+
+def _wait_retry_after(retry_state: RetryCallState) -> float:
+    """
+    Compute the delay before the next retry.
+
+    Honors the provider's Retry-After header (in seconds) on HTTP errors,
+    otherwise falls back to jittered exponential backoff starting at ~100ms
+    so concurrent clients don't retry in lockstep.
+    """
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, httpx.HTTPStatusError):
+        retry_after = exc.response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(float(retry_after), 60.0)
+            except ValueError:
+                pass  # HTTP-date form; use backoff instead
+    return _jittered_backoff(retry_state)
+
+
+def _is_cacheable(agent: Agent, deps: AgentDependencies) -> bool:
+    """
+    Whether a deterministic run may be served from the response cache.
+
+    Tools read live data (prices, balances, papers) and deps carry
+    per-run state, neither of which is part of the cache key.
+    """
+    if any(getattr(toolset, "tools", None) for toolset in agent.toolsets):
+        return False
+    return (
+        deps.http_client is None
+        and deps.trading_ctx is None
+        and deps.exchange is None
+        and not deps.shared_context
+    )
+
+
 @retry(
     stop=stop_after_attempt(4),
-    wait=wait_exponential(multiplier=1, min=2, max=16),
-    retry=retry_if_exception_type((httpx.HTTPStatusError, httpx.TimeoutException))
+    wait=_wait_retry_after,
+    retry=retry_if_exception_type(
+        (httpx.HTTPStatusError, httpx.TimeoutException, httpx.ConnectError)
+    )
 )
 async def run_agent(
     agent: Agent,
@@ -272,7 +442,10 @@ async def run_agent(
     """
     Run agent with a single message and dependencies.
 
-    Implements exponential backoff for rate limit and provider errors.
+    Implements jittered exponential backoff for rate limit and provider
+    errors, honoring Retry-After when the provider sends it.
+    Deterministic agents (temperature 0) without tools or per-run state
+    are served from the response cache.
 
     Args:
         agent: Configured Pydantic AI agent
@@ -283,10 +456,20 @@ async def run_agent(
         Structured agent output
     """
     if deps is None:
-        deps = AgentDependencies()
+        deps = _EMPTY_DEPS
+
+    model_settings = agent.model_settings or {}
+    async with _OPENROUTER_SEM:
+        if model_settings.get("temperature") == 0 and _is_cacheable(agent, deps):
+            key_extra = f"{agent.model.model_name}\x00{''.join(agent._system_prompts)}"
+            return await llm_cache.cached_run(agent, message, deps, key_extra)
+
+        result = await agent.run(message, deps=deps)
+    return result.output
+
 
-    result = await agent.run(message, deps=deps)
-    return result.data
+# Deltas arriving within this window are grouped into one chunk
+_STREAM_DEBOUNCE_SECONDS = 0.05
 
 
 async def run_agent_stream(
@@ -297,7 +480,9 @@ async def run_agent_stream(
     """
     Run agent with streaming output.
 
-    Yields chunks of the response as they're generated.
+    Yields only the new text of the response as it's generated; deltas
+    arriving within 50ms are grouped by pydantic-ai to amortize per-send
+    overhead.
 
     Args:
         agent: Configured Pydantic AI agent
@@ -305,11 +490,11 @@ async def run_agent_stream(
         deps: Optional dependencies for context
 
     Yields:
-        Response chunks as strings
+        Response chunks as strings; joined they form the full response
     """
     if deps is None:
-        deps = AgentDependencies()
+        deps = _EMPTY_DEPS
 
-    async with agent.run_stream(message, deps=deps) as stream:
-        async for chunk in stream.stream_text():
+    async with _OPENROUTER_SEM, agent.run_stream(message, deps=deps) as stream:
+        async for chunk in stream.stream_text(delta=True, debounce_by=_STREAM_DEBOUNCE_SECONDS):
             yield chunk
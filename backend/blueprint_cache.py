@@ -0,0 +1,86 @@
+"""
+Short-lived caches of agent blueprints.
+Avoids re-querying blueprint rows on every delegation tool call and on
+by-id API reads (GET /agents/{id}, chat).
+"""
+from typing import Optional
+from cachetools import TTLCache
+from sqlalchemy import select, bindparam
+from sqlalchemy.ext.asyncio import AsyncSession
+from models import AgentBlueprint
+
+_TTL_SECONDS = 30
+_ROW_TTL_SECONDS = 300
+
+# agent_id -> AgentBlueprint in any state, for by-id API reads
+_rows: TTLCache = TTLCache(maxsize=1024, ttl=_ROW_TTL_SECONDS)
+
+_ROW_BY_ID_STMT = select(AgentBlueprint).where(AgentBlueprint.id == bindparam("aid"))
+
+# agent_id -> active AgentBlueprint (detached ORM instance)
+_blueprints: TTLCache = TTLCache(maxsize=1024, ttl=_TTL_SECONDS)
+
+# Single-entry cache for the active agent_id -> name map
+_names: TTLCache = TTLCache(maxsize=1, ttl=_TTL_SECONDS)
+_NAMES_KEY = "active"
+
+
+def get_blueprint(agent_id: int) -> Optional[AgentBlueprint]:
+    """Return the cached active blueprint for an ID, if present."""
+    return _blueprints.get(agent_id)
+
+
+def set_blueprint(blueprint: AgentBlueprint) -> None:
+    """Cache an active blueprint by its ID."""
+    _blueprints[blueprint.id] = blueprint
+
+
+def get_names() -> Optional[dict[int, str]]:
+    """Return a copy of the cached active agent_id -> name map, if present."""
+    names = _names.get(_NAMES_KEY)
+    return dict(names) if names is not None else None
+
+
+def set_names(names: dict[int, str]) -> None:
+    """Cache the active agent_id -> name map."""
+    _names[_NAMES_KEY] = dict(names)
+
+
+async def fetch(db: AsyncSession, agent_id: int) -> Optional[AgentBlueprint]:
+    """
+    Read-through lookup of a blueprint by ID (active or not).
+
+    Args:
+        db: Database session used on a cache miss
+        agent_id: Blueprint ID
+
+    Returns:
+        AgentBlueprint, or None if it does not exist
+    """
+    blueprint = _rows.get(agent_id)
+    if blueprint is None:
+        result = await db.execute(_ROW_BY_ID_STMT, {"aid": agent_id})
+        blueprint = result.scalar_one_or_none()
+        if blueprint is not None:
+            _rows[agent_id] = blueprint
+    return blueprint
+
+
+def invalidate(agent_id: Optional[int] = None) -> None:
+    """
+    Invalidate cached blueprint data after a write.
+
+    Args:
+        agent_id: Blueprint to drop; the name map is always cleared
+    """
+    if agent_id is not None:
+        _blueprints.pop(agent_id, None)
+        _rows.pop(agent_id, None)
+    _names.clear()
+
+
+def clear() -> None:
+    """Drop all cached blueprint data."""
+    _blueprints.clear()
+    _rows.clear()
+    _names.clear()
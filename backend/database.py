@@ -2,11 +2,17 @@
 Database configuration with async SQLAlchemy for AgentFactory.
 Implements proper session management and engine disposal.
 """
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Callable, Optional
+from sqlalchemy import String, event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session, raiseload
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.types import TypeDecorator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 import os
+import tempfile
+import orjson
+import enum
 
 
 class Settings(BaseSettings):
@@ -15,6 +21,12 @@ class Settings(BaseSettings):
     openrouter_api_key: str
     exchange_api_key: str = ""
     exchange_secret: str = ""
+    sql_echo: bool = False  # Log every SQL statement (debugging only)
+    db_pool_size: int = 20  # Persistent connections per process
+    db_max_overflow: int = 40  # Extra connections opened under burst load
+    openrouter_max_inflight: int = 32  # Concurrent LLM requests per process
+    cors_origins: list[str] = ["http://localhost:8501"]  # Browser origins allowed to call the API
+    markets_cache_dir: str = os.path.join(tempfile.gettempdir(), "agentfactory-markets")
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -26,15 +38,30 @@ class Settings(BaseSettings):
 # Initialize settings
 settings = Settings()
 
+def _json_serializer(value) -> str:
+    """Serialize JSON column values with orjson (non-str keys as in json.dumps)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create async engine
+# AsyncAdaptedQueuePool (not QueuePool) is the asyncio-safe queue pool
 engine = create_async_engine(
     settings.database_url,
-    echo=True,
+    echo=settings.sql_echo,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    poolclass=AsyncAdaptedQueuePool,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=30,
+    pool_recycle=1800
 )
 
+# A forked worker must not reuse the parent's pooled sockets; drop them
+# (without closing the parent's connections) so the child opens its own
+os.register_at_fork(after_in_child=lambda: engine.sync_engine.dispose(close=False))
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -50,16 +77,94 @@ class Base(DeclarativeBase):
     pass
 
 
+def after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """
+    Run callback once the session's current transaction commits.
+
+    Cache invalidation belongs here rather than inline in a handler:
+    get_db_rw commits only after the response is sent, and invalidating
+    before that lets a concurrent read re-cache the pre-commit rows.
+    Callbacks are dropped if the transaction rolls back.
+    """
+    session.sync_session.info.setdefault("after_commit", []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit(session: Session) -> None:
+    for callback in session.info.pop("after_commit", ()):
+        callback()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_after_commit(session: Session, previous_transaction) -> None:
+    session.info.pop("after_commit", None)
+
+
+def strict_load(*options) -> list:
+    """
+    Return loader options with raiseload("*") appended.
+
+    Relationships not eager-loaded by the given options raise on access
+    instead of silently issuing a query per row.
+
+    Usage:
+        select(Workflow).options(*strict_load(selectinload(Workflow.nodes)))
+    """
+    return [*options, raiseload("*")]
+
+
+class ShortEnum(TypeDecorator):
+    """
+    Stores a str Enum as a short code instead of its member name.
+    Python code keeps reading and writing enum members.
+    """
+    impl = String
+    cache_ok = True
+
+    def __init__(self, enum_class: type[enum.Enum], codes: dict[enum.Enum, str], length: int = 1):
+        super().__init__(length=length)
+        self.enum_class = enum_class
+        # Tuple rather than dict so the type stays hashable for the statement cache
+        self.codes = tuple(codes.items())
+        self._to_code = dict(codes)
+        self._from_code = {code: member for member, code in codes.items()}
+
+    def process_bind_param(self, value, dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return self._to_code[self.enum_class(value)]
+
+    def process_result_value(self, value, dialect) -> Optional[enum.Enum]:
+        if value is None:
+            return None
+        return self._from_code[value]
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    Async dependency for database sessions.
-    Ensures proper cleanup and transaction management.
+    Async dependency for read-only database sessions.
+    No commit is issued; the session context manager closes the session
+    and returns the connection to the pool.
 
     Usage in FastAPI:
         @app.get("/items")
         async def read_items(db: AsyncSession = Depends(get_db)):
             ...
     """
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def get_db_rw() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async dependency for read-write database sessions.
+    Commits on success and rolls back on error.
+
+    Usage in FastAPI:
+        @app.post("/items")
+        async def create_item(db: AsyncSession = Depends(get_db_rw)):
+            ...
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -67,12 +172,15 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
 
 
 async def init_db() -> None:
-    """Initialize database tables. Called during app startup."""
+    """
+    Create missing tables. Called during app startup.
+
+    Changes to existing tables ship as versioned migrations (migrate.py),
+    run once per deploy rather than by every worker on boot.
+    """
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
@@ -3,17 +3,35 @@ Dynamic agent delegation system.
 Allows agents to delegate tasks to other agents at runtime.
 """
 from typing import Any, Optional
-from datetime import datetime
-from pydantic import BaseModel
+from collections import deque
+import asyncio
+from datetime import datetime, timezone
+from functools import cached_property, lru_cache
+import time
+from pydantic import BaseModel, PrivateAttr
 from pydantic_ai import Agent, RunContext
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, bindparam
 from models import AgentBlueprint
-from agents import create_agent, AgentDependencies, AgentOutput
+from agents import create_agent, get_or_build_agent, AgentDependencies, AgentOutput
+import blueprint_cache
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Statements built once at import so SQLAlchemy's compiled cache is reused
+_AVAILABLE_AGENTS_STMT = (
+    select(AgentBlueprint.id, AgentBlueprint.name)
+    .where(AgentBlueprint.is_active.is_(True))
+)
+_BLUEPRINT_BY_ID_STMT = (
+    select(AgentBlueprint)
+    .where(
+        AgentBlueprint.id == bindparam("aid"),
+        AgentBlueprint.is_active.is_(True)
+    )
+)
+
 
 class DelegationContext(BaseModel):
     """
@@ -22,9 +40,27 @@ class DelegationContext(BaseModel):
     """
     db_session: Any  # AsyncSession (can't use directly due to Pydantic)
     available_agents: dict[int, str] = {}  # agent_id -> agent_name mapping
-    delegation_history: list[dict[str, Any]] = []
     max_delegation_depth: int = 5  # Prevent infinite delegation loops
 
+    # Bounded history kept outside validation; appends are O(1)
+    _history: deque = PrivateAttr(default_factory=lambda: deque(maxlen=64))
+    # Serializes db_session use; parallel workflow nodes share this context
+    _db_lock: asyncio.Lock = PrivateAttr(default_factory=asyncio.Lock)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Size the history buffer relative to the delegation depth limit."""
+        self._history = deque(maxlen=max(self.max_delegation_depth * 4, 1))
+
+    @property
+    def delegation_history(self) -> list[dict[str, Any]]:
+        """Read-only snapshot of delegation history entries."""
+        return list(self._history)
+
+    @property
+    def delegation_depth(self) -> int:
+        """Number of delegations recorded so far."""
+        return len(self._history)
+
 
 class DelegationResult(BaseModel):
     """Result of a delegation operation."""
@@ -32,28 +68,38 @@ class DelegationResult(BaseModel):
     agent_name: str
     response: str
     reasoning: Optional[str] = None
-    timestamp: datetime
+    timestamp_ns: int  # time.time_ns() at completion
     delegation_depth: int
 
+    @cached_property
+    def timestamp(self) -> datetime:
+        """Completion time as a timezone-aware UTC datetime, built on first access."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, tz=timezone.utc)
+
 
 async def get_available_agents(db: AsyncSession) -> dict[int, str]:
     """
     Fetch all active agents from the database.
     Returns a mapping of agent_id -> agent_name.
+
+    Served from the blueprint cache when fresh (30s TTL).
     """
-    result = await db.execute(
-        select(AgentBlueprint.id, AgentBlueprint.name)
-        .where(AgentBlueprint.is_active == True)
-    )
-    agents = result.all()
-    return {agent_id: agent_name for agent_id, agent_name in agents}
+    cached = blueprint_cache.get_names()
+    if cached is not None:
+        return cached
+
+    result = await db.execute(_AVAILABLE_AGENTS_STMT)
+    agents = {agent_id: agent_name for agent_id, agent_name in result.all()}
+    blueprint_cache.set_names(agents)
+    return agents
 
 
 async def delegate_to_agent(
     target_agent_id: int,
     message: str,
     delegation_ctx: DelegationContext,
-    shared_context: Optional[dict[str, Any]] = None
+    shared_context: Optional[dict[str, Any]] = None,
+    blueprint: Optional[AgentBlueprint] = None
 ) -> DelegationResult:
     """
     Delegate a task to another agent.
@@ -63,6 +109,7 @@ async def delegate_to_agent(
         message: Message/task for the delegated agent
         delegation_ctx: Delegation context with DB session and history
         shared_context: Optional shared state to pass to the agent
+        blueprint: Already-resolved active blueprint; skips the database lookup
 
     Returns:
         DelegationResult with agent response
@@ -71,29 +118,29 @@ async def delegate_to_agent(
         ValueError: If delegation depth exceeded or agent not found
     """
     # Check delegation depth
-    current_depth = len(delegation_ctx.delegation_history)
+    current_depth = delegation_ctx.delegation_depth
     if current_depth >= delegation_ctx.max_delegation_depth:
         raise ValueError(
             f"Maximum delegation depth ({delegation_ctx.max_delegation_depth}) exceeded. "
             "Possible infinite delegation loop detected."
         )
 
-    # Verify agent exists and is active
-    db = delegation_ctx.db_session
-    result = await db.execute(
-        select(AgentBlueprint)
-        .where(
-            AgentBlueprint.id == target_agent_id,
-            AgentBlueprint.is_active == True
-        )
-    )
-    agent_blueprint = result.scalar_one_or_none()
+    # Verify agent exists and is active unless the caller already resolved it
+    agent_blueprint = blueprint
+    if agent_blueprint is None:
+        db = delegation_ctx.db_session
+        async with delegation_ctx._db_lock:
+            result = await db.execute(_BLUEPRINT_BY_ID_STMT, {"aid": target_agent_id})
+        agent_blueprint = result.scalar_one_or_none()
 
-    if not agent_blueprint:
-        raise ValueError(f"Agent with ID {target_agent_id} not found or inactive")
+        if not agent_blueprint:
+            raise ValueError(f"Agent with ID {target_agent_id} not found or inactive")
 
-    # Create agent instance from blueprint
-    agent = create_agent(
+        blueprint_cache.set_blueprint(agent_blueprint)
+
+    # Reuse a cached agent instance for this blueprint
+    agent = get_or_build_agent(
+        blueprint_id=agent_blueprint.id,
         system_prompt=agent_blueprint.system_prompt,
         model_id=agent_blueprint.model_id,
         temperature=agent_blueprint.temperature,
@@ -102,9 +149,7 @@ async def delegate_to_agent(
     )
 
     # Prepare dependencies with shared context
-    deps = AgentDependencies()
-    if shared_context:
-        deps.model_extra = {"shared_context": shared_context}
+    deps = AgentDependencies.model_construct(shared_context=shared_context or {})
 
     # Execute agent
     logger.info(
@@ -113,7 +158,7 @@ async def delegate_to_agent(
 
     try:
         result_data = await agent.run(message, deps=deps)
-        agent_output: AgentOutput = result_data.data
+        agent_output: AgentOutput = result_data.output
 
         # Create delegation result
         delegation_result = DelegationResult(
@@ -121,16 +166,16 @@ async def delegate_to_agent(
             agent_name=agent_blueprint.name,
             response=agent_output.response,
             reasoning=agent_output.reasoning,
-            timestamp=datetime.utcnow(),
+            timestamp_ns=time.time_ns(),
             delegation_depth=current_depth + 1
         )
 
         # Update delegation history
-        delegation_ctx.delegation_history.append({
+        delegation_ctx._history.append({
             "agent_id": target_agent_id,
             "agent_name": agent_blueprint.name,
             "message": message,
-            "timestamp": delegation_result.timestamp.isoformat(),
+            "timestamp_ns": delegation_result.timestamp_ns,
             "depth": delegation_result.delegation_depth
         })
 
@@ -191,7 +236,7 @@ def register_delegation_tool(
             }
 
         # Get shared context from current agent's dependencies
-        shared_context = getattr(ctx.deps, "model_extra", {}).get("shared_context", {})
+        shared_context = ctx.deps.shared_context
 
         # Perform delegation
         try:
@@ -199,14 +244,16 @@ def register_delegation_tool(
                 target_agent_id=agent_id,
                 message=task_description,
                 delegation_ctx=delegation_ctx,
-                shared_context=shared_context
+                shared_context=shared_context,
+                blueprint=blueprint_cache.get_blueprint(agent_id)
             )
 
             return {
                 "delegated_to": result.agent_name,
                 "response": result.response,
                 "reasoning": result.reasoning,
-                "delegation_depth": result.delegation_depth
+                "delegation_depth": result.delegation_depth,
+                "max_delegation_depth": delegation_ctx.max_delegation_depth
             }
 
         except ValueError as e:
@@ -216,6 +263,30 @@ def register_delegation_tool(
             return {"error": f"Delegation failed: {str(e)}"}
 
 
+@lru_cache(maxsize=128)
+def _delegation_prompt(agents: tuple[tuple[int, str], ...]) -> str:
+    """
+    Build the delegation instructions appended to an agent's system prompt.
+
+    Cached by the (sorted) available-agent list. The text contains no
+    per-call state so the system prompt prefix stays stable across calls,
+    which keeps provider-side prompt caching effective.
+    """
+    agent_lines = chr(10).join(f'- Agent {aid}: {name}' for aid, name in agents)
+    return f"""
+
+You have access to a special delegation capability. Available agents:
+{agent_lines}
+
+Use the `delegate_to_another_agent` tool when:
+- A task requires specialized expertise
+- You need to break down complex workflows
+- Another agent is better suited for a subtask
+
+The tool reports the current and maximum delegation depth in its response.
+"""
+
+
 def create_agent_with_delegation(
     blueprint: AgentBlueprint,
     delegation_ctx: DelegationContext
@@ -230,8 +301,6 @@ def create_agent_with_delegation(
     Returns:
         Configured Agent with delegation tool
     """
-    from agents import create_agent
-
     agent = create_agent(
         system_prompt=blueprint.system_prompt,
         model_id=blueprint.model_id,
@@ -241,18 +310,9 @@ def create_agent_with_delegation(
     )
 
     # Augment system prompt with delegation instructions
-    delegation_prompt = f"""
-
-You have access to a special delegation capability. Available agents:
-{chr(10).join(f'- Agent {aid}: {name}' for aid, name in delegation_ctx.available_agents.items())}
-
-Use the `delegate_to_another_agent` tool when:
-- A task requires specialized expertise
-- You need to break down complex workflows
-- Another agent is better suited for a subtask
-
-Current delegation depth: {len(delegation_ctx.delegation_history)}/{delegation_ctx.max_delegation_depth}
-"""
+    delegation_prompt = _delegation_prompt(
+        tuple(sorted(delegation_ctx.available_agents.items()))
+    )
 
     # Update agent's system prompt
     agent._system_prompt = agent._system_prompt + delegation_prompt
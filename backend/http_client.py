@@ -0,0 +1,40 @@
+"""
+Shared async HTTP client for outbound OpenRouter and research API calls.
+Keeps a single pooled connection set alive for the process lifetime.
+"""
+from typing import Optional
+import httpx
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_openrouter_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide pooled HTTP client, creating it on first use.
+
+    Reusing one client avoids a TCP+TLS handshake per agent instance
+    and keeps sockets from leaking when agents are discarded.
+
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=200,
+                max_keepalive_connections=100,
+                keepalive_expiry=30
+            ),
+            http2=True
+        )
+    return _client
+
+
+async def close_openrouter_client() -> None:
+    """Close the shared HTTP client. Called during app shutdown."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,93 @@
+"""
+Short-lived cache of list endpoint results, grouped by namespace.
+Serves stale-while-revalidate; writes invalidate their namespace.
+"""
+from typing import Hashable, Optional
+import time
+from cachetools import TTLCache
+
+# Entries younger than this are fresh; older ones are served but refreshed
+_SOFT_TTL_SECONDS = 30
+# Entries older than this are dropped and rebuilt on the request path
+_HARD_TTL_SECONDS = 120
+
+# namespace -> {query key -> (generated_at, serialized JSON body)}
+_namespaces: dict[str, TTLCache] = {}
+
+# namespace -> write counter, so a refresh never re-caches pre-write data
+_generations: dict[str, int] = {}
+
+# (namespace, key) pairs with a background refresh in flight
+_refreshing: set[tuple[str, Hashable]] = set()
+
+
+def get(namespace: str, key: Hashable) -> Optional[tuple[bytes, bool]]:
+    """
+    Return the cached response body for a list query, if present.
+
+    Returns:
+        Tuple of (body, is_stale), or None on a miss
+    """
+    cache = _namespaces.get(namespace)
+    entry = cache.get(key) if cache is not None else None
+    if entry is None:
+        return None
+    generated_at, body = entry
+    return body, time.monotonic() - generated_at > _SOFT_TTL_SECONDS
+
+
+def generation(namespace: str) -> int:
+    """Return the namespace write counter; pass it back to set()."""
+    return _generations.get(namespace, 0)
+
+
+def set(
+    namespace: str,
+    key: Hashable,
+    body: bytes,
+    built_at_generation: Optional[int] = None
+) -> None:
+    """
+    Cache the serialized response body for a list query.
+
+    Args:
+        namespace: Cache namespace (e.g. "agents")
+        key: Query key within the namespace
+        body: JSON response body to cache
+        built_at_generation: generation() read before the query ran; the
+            result is discarded if a write happened since
+    """
+    if built_at_generation is not None and built_at_generation != generation(namespace):
+        return
+    cache = _namespaces.get(namespace)
+    if cache is None:
+        cache = _namespaces[namespace] = TTLCache(maxsize=256, ttl=_HARD_TTL_SECONDS)
+    cache[key] = (time.monotonic(), body)
+
+
+def claim_refresh(namespace: str, key: Hashable) -> bool:
+    """Mark a key as refreshing; False if a refresh is already in flight."""
+    if (namespace, key) in _refreshing:
+        return False
+    _refreshing.add((namespace, key))
+    return True
+
+
+def release_refresh(namespace: str, key: Hashable) -> None:
+    """Clear the in-flight refresh mark for a key."""
+    _refreshing.discard((namespace, key))
+
+
+def invalidate(namespace: str) -> None:
+    """Drop every cached list in a namespace after a write."""
+    _generations[namespace] = generation(namespace) + 1
+    cache = _namespaces.get(namespace)
+    if cache is not None:
+        cache.clear()
+
+
+def clear() -> None:
+    """Drop all cached lists."""
+    _namespaces.clear()
+    _generations.clear()
+    _refreshing.clear()
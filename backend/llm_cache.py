@@ -0,0 +1,67 @@
+"""
+In-process response cache for deterministic agent runs.
+Skips the LLM call when the same prompt/message pair was answered before.
+"""
+from typing import Any
+import hashlib
+from cachetools import TTLCache
+from pydantic import BaseModel
+from pydantic_ai import Agent
+
+_CACHE_MAXSIZE = 4096
+# Bounds staleness if a provider changes its model behind the same ID
+_CACHE_TTL_SECONDS = 3600
+
+# key -> (output model class, serialized output)
+_cache: TTLCache = TTLCache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL_SECONDS)
+
+
+def _hash(message: str, key_extra: str) -> str:
+    """Build a cache key from the message and caller-supplied context."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(key_extra.encode())
+    digest.update(b"\x00")
+    digest.update(message.encode())
+    return digest.hexdigest()
+
+
+async def cached_run(
+    agent: Agent,
+    message: str,
+    deps: Any,
+    key_extra: str
+) -> BaseModel:
+    """
+    Run an agent, serving repeated (key_extra, message) pairs from cache.
+
+    Only safe for deterministic runs (temperature 0) of agents without
+    tools and with stateless deps; the caller decides. deps is passed to
+    the agent but is not part of the cache key.
+
+    Args:
+        agent: Configured Pydantic AI agent
+        message: User message
+        deps: Dependencies for the run
+        key_extra: Extra key material (model ID, system prompt, ...)
+
+    Returns:
+        Structured agent output
+    """
+    key = _hash(message, key_extra)
+
+    hit = _cache.get(key)
+    if hit is not None:
+        output_cls, raw = hit
+        return output_cls.model_validate_json(raw)
+
+    result = await agent.run(message, deps=deps)
+    output = result.output
+
+    _cache[key] = (type(output), output.model_dump_json())
+
+    return output
+
+
+def clear_cache() -> None:
+    """Drop all cached responses."""
+    _cache.clear()
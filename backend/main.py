@@ -2,16 +2,26 @@
 FastAPI backend for AgentFactory.
 Implements lifespan context manager, CRUD endpoints, and streaming chat.
 """
-from contextlib import asynccontextmanager
-from typing import AsyncIterator
-from fastapi import FastAPI, Depends, HTTPException, status
-from fastapi.responses import StreamingResponse
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, Optional, Sequence
+from logging.handlers import QueueHandler, QueueListener
+import asyncio
+import logging
+import queue
+import sys
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
-import httpx
+from sqlalchemy import select, insert, update, delete, func, any_, lambda_stmt
+from pydantic import BaseModel
+import ccxt.async_support as ccxt
+import orjson
 
-from database import get_db, init_db, dispose_db
+from database import get_db, get_db_rw, init_db, dispose_db, settings, strict_load, after_commit
+from http_client import get_openrouter_client, close_openrouter_client
 from models import AgentBlueprint
 from schemas import (
     AgentBlueprintCreate,
@@ -20,8 +30,10 @@ from schemas import (
     AgentBlueprintList,
     ChatRequest,
 )
-from agents import create_agent, run_agent_stream, AgentDependencies
-from tools import TradingContext, get_exchange
+import blueprint_cache
+import list_cache
+from agents import create_agent, run_agent_stream, invalidate_agent_cache, AgentDependencies
+from tools import TradingContext, get_exchange, exchange_cache_key, load_markets_cached
 
 # Workflow orchestration imports
 from workflow_models import Workflow, WorkflowNode, WorkflowEdge, WorkflowExecution, WorkflowExecutionLog
@@ -42,7 +54,7 @@ from workflow_schemas import (
     WorkflowExecutionDetailResponse,
     WorkflowExecutionLogResponse,
 )
-from orchestrator import WorkflowOrchestrator
+from orchestrator import get_orchestrator
 
 # Research assistant imports
 from models import SavedCitation
@@ -60,23 +72,119 @@ from research_schemas import (
 from research_tools import search_arxiv, search_pubmed, scrape_webpage, format_citation
 
 
+logger = logging.getLogger("agentfactory")
+
+
+def configure_logging() -> QueueListener:
+    """
+    Route root logging through a queue drained by a background thread.
+
+    Request handlers only enqueue records, so a slow stdout sink
+    (docker logs, journald) never blocks the event loop.
+
+    Returns:
+        Started listener; stop it on shutdown to flush pending records
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(logging.INFO)
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+# How often shared exchanges re-pull their market listings
+MARKETS_REFRESH_SECONDS = 300
+
+
+async def get_shared_exchange(app: FastAPI, trading_ctx: TradingContext) -> ccxt.Exchange:
+    """
+    Return the app-wide exchange for a trading context, loading markets once.
+
+    Exchanges are keyed by (exchange_id, testnet, API key fingerprint) and
+    live until shutdown, so chat requests skip the load_markets() round trip.
+
+    Args:
+        app: FastAPI application holding the exchange registry
+        trading_ctx: Trading context with exchange ID and credentials
+
+    Returns:
+        Exchange instance with markets loaded
+    """
+    key = exchange_cache_key(trading_ctx)
+    exchange = app.state.exchanges.get(key)
+    if exchange is None:
+        async with app.state.exchanges_lock:
+            exchange = app.state.exchanges.get(key)
+            if exchange is None:
+                exchange = get_exchange(trading_ctx)
+                try:
+                    await load_markets_cached(exchange, trading_ctx)  # CRITICAL: Load markets before operations
+                except Exception:
+                    await exchange.close()  # Release its HTTP session
+                    raise
+                app.state.exchanges[key] = exchange
+    return exchange
+
+
+async def refresh_exchange_markets(app: FastAPI) -> None:
+    """Periodically reload market listings of the shared exchanges."""
+    while True:
+        await asyncio.sleep(MARKETS_REFRESH_SECONDS)
+        for (exchange_id, testnet, _), exchange in list(app.state.exchanges.items()):
+            ctx = TradingContext(exchange_id=exchange_id, testnet=testnet)
+            try:
+                await load_markets_cached(exchange, ctx, reload=True)
+            except Exception as e:
+                logger.warning(f"Market refresh failed for {exchange.id}: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Lifespan context manager for FastAPI.
-    Handles startup (DB table creation) and shutdown (engine disposal).
+    Handles startup (DB table creation, shared clients) and shutdown
+    (engine disposal, client cleanup).
     """
     # Startup
-    print("🚀 Starting AgentFactory backend...")
+    log_listener = configure_logging()
+    logger.info("Starting AgentFactory backend...")
     await init_db()
-    print("✅ Database initialized")
+    logger.info("Database initialized")
+
+    # Build the OpenAPI schema now instead of on the first /openapi.json hit
+    app.openapi()
+
+    app.state.http_client = get_openrouter_client()
+    app.state.exchanges = {}
+    app.state.exchanges_lock = asyncio.Lock()
+    refresh_task = asyncio.create_task(refresh_exchange_markets(app))
 
     yield
 
     # Shutdown
-    print("🛑 Shutting down AgentFactory backend...")
+    logger.info("Shutting down AgentFactory backend...")
+    refresh_task.cancel()
+    # Let the refresh loop unwind before the exchanges it uses are closed
+    with suppress(asyncio.CancelledError):
+        await refresh_task
+    await get_orchestrator().drain()
+    logger.info("Workflow executions drained")
+    for exchange in app.state.exchanges.values():
+        await exchange.close()
+    app.state.exchanges.clear()
     await dispose_db()
-    print("✅ Database engine disposed")
+    logger.info("Database engine disposed")
+    await close_openrouter_client()
+    logger.info("HTTP client closed")
+    log_listener.stop()
 
 
 # Initialize FastAPI app with lifespan
@@ -84,19 +192,203 @@ app = FastAPI(
     title="AgentFactory API",
     description="Backend for AI agent deployment and management",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# Configure CORS
+# Compress JSON bodies (list endpoints, openapi.json) above 512 bytes
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
+# Configure CORS (added last so it runs first and answers preflights directly)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=settings.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PATCH", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,
 )
 
 
+async def fetch_page_and_total(
+    db: AsyncSession,
+    page_query: Any,
+    count_query: Any
+) -> tuple[Sequence[Any], int]:
+    """
+    Run a paginated query and then its count query on the same session.
+
+    The two queries run one after the other on purpose. Gathering them
+    needs a sibling session, which doubles the pooled connections each
+    list request holds. Page rows are streamed in small batches rather
+    than buffered in one fetch.
+
+    Args:
+        db: Request database session (runs both queries)
+        page_query: Paginated SELECT of ORM entities
+        count_query: SELECT COUNT(...) with the same filters
+
+    Returns:
+        Tuple of (page rows, total count)
+    """
+    rows = await stream_all(db, page_query, batch_size=PAGE_BATCH_SIZE)
+    total = await db.scalar(count_query)
+    return rows, total
+
+
+# Strong references to in-flight background refreshes (tasks are weakly held)
+_refresh_tasks: set[asyncio.Task] = set()
+
+
+async def serve_cached_list(
+    namespace: str,
+    key: Hashable,
+    db: AsyncSession,
+    build: Callable[[AsyncSession], Awaitable[dict]],
+    response_model: type[BaseModel]
+) -> Response:
+    """
+    Serve a list response stale-while-revalidate from list_cache.
+
+    Fresh hits return immediately. Stale hits also return immediately and
+    schedule one background rebuild on a sibling session. Misses build on
+    the request session. The cache holds the serialized JSON body, so a
+    hit does no ORM-to-JSON work.
+
+    Args:
+        namespace: list_cache namespace invalidated by writes
+        key: Query key within the namespace
+        db: Request database session
+        build: Coroutine function building the response from a session
+        response_model: Schema the built response is serialized with
+
+    Returns:
+        JSON response
+    """
+    hit = list_cache.get(namespace, key)
+    if hit is not None:
+        body, stale = hit
+        if stale and list_cache.claim_refresh(namespace, key):
+            task = asyncio.create_task(
+                refresh_cached_list(namespace, key, db.bind, build, response_model)
+            )
+            _refresh_tasks.add(task)
+            task.add_done_callback(_refresh_tasks.discard)
+        return Response(body, media_type="application/json")
+
+    built_at = list_cache.generation(namespace)
+    body = serialize_list(response_model, await build(db))
+    list_cache.set(namespace, key, body, built_at)
+    return Response(body, media_type="application/json")
+
+
+def serialize_list(response_model: type[BaseModel], response: dict) -> bytes:
+    """Validate a built list response (ORM rows included) and dump it to JSON."""
+    return response_model.model_validate(response, from_attributes=True).model_dump_json().encode()
+
+
+async def refresh_cached_list(
+    namespace: str,
+    key: Hashable,
+    bind: Any,
+    build: Callable[[AsyncSession], Awaitable[dict]],
+    response_model: type[BaseModel]
+) -> None:
+    """Rebuild one cached list response in the background."""
+    try:
+        built_at = list_cache.generation(namespace)
+        async with AsyncSession(bind) as session:
+            body = serialize_list(response_model, await build(session))
+        list_cache.set(namespace, key, body, built_at)
+    except Exception as e:
+        logger.warning(f"Background refresh of {namespace} list failed: {e}")
+    finally:
+        list_cache.release_refresh(namespace, key)
+
+
+def ids_filter(db: AsyncSession, column: Any, ids: list[int]) -> Any:
+    """
+    Build an "id in ids" filter with a plan shape that does not vary by length.
+
+    PostgreSQL gets "= ANY(:ids)" with a single array parameter; other
+    dialects fall back to IN.
+
+    Args:
+        db: Database session (used to detect the dialect)
+        column: Integer column to filter on
+        ids: Values to match
+
+    Returns:
+        SQL expression for a WHERE clause
+    """
+    if db.bind.dialect.name == "postgresql":
+        return column == any_(ids)
+    return column.in_(ids)
+
+
+def model_response(model: Any) -> Response:
+    """
+    Serialize a response model directly, bypassing response_model validation.
+
+    FastAPI dumps and re-validates returned models against response_model;
+    for model_construct results built from database rows that undoes the
+    point of skipping validation. The route keeps response_model for docs.
+    """
+    return Response(model.model_dump_json(), media_type="application/json")
+
+
+def next_cursor(rows: Sequence[Any], limit: int) -> Optional[int]:
+    """Return the keyset cursor for the page after rows, or None on the last page."""
+    return rows[-1].id if rows and len(rows) >= limit else None
+
+
+# Rows materialized per batch when streaming large result sets
+STREAM_BATCH_SIZE = 1000
+PAGE_BATCH_SIZE = 50
+
+
+async def stream_all(
+    db: AsyncSession,
+    query: Any,
+    batch_size: int = STREAM_BATCH_SIZE
+) -> list[Any]:
+    """
+    Collect ORM entities from a server-side cursor in fixed-size batches.
+
+    Args:
+        db: Database session to stream on
+        query: SELECT of ORM entities
+        batch_size: Rows materialized per batch (yield_per)
+
+    Returns:
+        List of entities
+    """
+    result = await db.stream_scalars(
+        query.execution_options(yield_per=batch_size)
+    )
+    return [row async for row in result]
+
+
+async def stream_mappings(
+    db: AsyncSession,
+    query: Any,
+    batch_size: int = STREAM_BATCH_SIZE
+) -> list[Any]:
+    """
+    Collect Core rows as column-name mappings, without ORM hydration.
+
+    Args:
+        db: Database session to stream on
+        query: SELECT of table columns
+        batch_size: Rows fetched per batch (yield_per)
+
+    Returns:
+        List of RowMapping objects
+    """
+    result = await db.stream(query.execution_options(yield_per=batch_size))
+    return [row async for row in result.mappings()]
+
+
 # ============================================================================
 # CRUD Endpoints for Agent Blueprints
 # ============================================================================
@@ -108,7 +400,7 @@ app.add_middleware(
 )
 async def create_agent_blueprint(
     blueprint: AgentBlueprintCreate,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_rw)
 ) -> AgentBlueprint:
     """
     Create a new agent blueprint.
@@ -120,10 +412,13 @@ async def create_agent_blueprint(
     Returns:
         Created agent blueprint with ID
     """
-    db_blueprint = AgentBlueprint(**blueprint.model_dump())
-    db.add(db_blueprint)
-    await db.flush()
-    await db.refresh(db_blueprint)
+    # INSERT ... RETURNING: one round trip instead of flush + refresh
+    stmt = insert(AgentBlueprint).values(**blueprint.model_dump()).returning(AgentBlueprint)
+    db_blueprint = (await db.execute(stmt)).scalar_one()
+    after_commit(db, blueprint_cache.invalidate)
+    after_commit(db, lambda: list_cache.invalidate("agents"))
+    # Commit before responding so the client's next read sees the write
+    await db.commit()
     return db_blueprint
 
 
@@ -132,42 +427,57 @@ async def list_agent_blueprints(
     skip: int = 0,
     limit: int = 100,
     active_only: bool = True,
+    after_id: Optional[int] = None,
+    ids: Optional[list[int]] = Query(None),
     db: AsyncSession = Depends(get_db)
-) -> dict:
+) -> Response:
     """
     List agent blueprints with pagination.
 
     Args:
-        skip: Number of records to skip
+        skip: Number of records to skip (legacy; ignored when after_id is set)
         limit: Maximum number of records to return
         active_only: Filter for active agents only
+        after_id: Keyset cursor; return agents with a lower ID than this.
+            Omit it (with skip=0) for the first page, then pass next_cursor
+        ids: Restrict to these agent IDs (bulk fetch, ?ids=1&ids=2)
         db: Database session
 
     Returns:
-        Paginated list of agent blueprints
+        Paginated list of agent blueprints with the next cursor
     """
-    query = select(AgentBlueprint)
+    async def build(session: AsyncSession) -> dict:
+        query = select(AgentBlueprint).options(*strict_load())
+        count_query = select(func.count(AgentBlueprint.id))
 
-    if active_only:
-        query = query.where(AgentBlueprint.is_active == True)
+        if active_only:
+            query = query.where(AgentBlueprint.is_active == True)
+            count_query = count_query.where(AgentBlueprint.is_active == True)
 
-    query = query.offset(skip).limit(limit).order_by(AgentBlueprint.created_at.desc())
+        if ids:
+            id_filter = ids_filter(session, AgentBlueprint.id, ids)
+            query = query.where(id_filter)
+            count_query = count_query.where(id_filter)
 
-    result = await db.execute(query)
-    agents = result.scalars().all()
+        # One ordering for both modes, so a cursor continues any page in sequence
+        query = query.order_by(AgentBlueprint.id.desc()).limit(limit)
+        if after_id is not None:
+            # Keyset pagination seeks on the primary key instead of scanning skipped rows
+            query = query.where(AgentBlueprint.id < after_id)
+        else:
+            query = query.offset(skip)
 
-    # Count total
-    count_query = select(AgentBlueprint)
-    if active_only:
-        count_query = count_query.where(AgentBlueprint.is_active == True)
+        agents, total = await fetch_page_and_total(session, query, count_query)
 
-    count_result = await db.execute(count_query)
-    total = len(count_result.scalars().all())
+        return {
+            "total": total,
+            "agents": agents,
+            # Offset pages (skip > 0) are legacy; only the first page and keyset pages carry a cursor
+            "next_cursor": next_cursor(agents, limit) if after_id is not None or not skip else None
+        }
 
-    return {
-        "total": total,
-        "agents": agents
-    }
+    cache_key = (skip, limit, active_only, after_id, tuple(ids) if ids else None)
+    return await serve_cached_list("agents", cache_key, db, build, AgentBlueprintList)
 
 
 @app.get("/agents/{agent_id}", response_model=AgentBlueprintResponse)
@@ -188,9 +498,7 @@ async def get_agent_blueprint(
     Raises:
         HTTPException: If agent not found
     """
-    query = select(AgentBlueprint).where(AgentBlueprint.id == agent_id)
-    result = await db.execute(query)
-    agent = result.scalar_one_or_none()
+    agent = await blueprint_cache.fetch(db, agent_id)
 
     if not agent:
         raise HTTPException(
@@ -205,7 +513,7 @@ async def get_agent_blueprint(
 async def update_agent_blueprint(
     agent_id: int,
     blueprint_update: AgentBlueprintUpdate,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_rw)
 ) -> AgentBlueprint:
     """
     Update an existing agent blueprint.
@@ -221,10 +529,18 @@ async def update_agent_blueprint(
     Raises:
         HTTPException: If agent not found
     """
-    # Check if agent exists
-    query = select(AgentBlueprint).where(AgentBlueprint.id == agent_id)
-    result = await db.execute(query)
-    agent = result.scalar_one_or_none()
+    # Update fields and fetch the row in a single round trip
+    update_data = blueprint_update.model_dump(exclude_unset=True)
+    if update_data:
+        stmt = (
+            update(AgentBlueprint)
+            .where(AgentBlueprint.id == agent_id)
+            .values(**update_data)
+            .returning(AgentBlueprint)
+        )
+        agent = (await db.execute(stmt)).scalar_one_or_none()
+    else:
+        agent = await db.get(AgentBlueprint, agent_id)
 
     if not agent:
         raise HTTPException(
@@ -232,17 +548,12 @@ async def update_agent_blueprint(
             detail=f"Agent blueprint {agent_id} not found"
         )
 
-    # Update fields
-    update_data = blueprint_update.model_dump(exclude_unset=True)
     if update_data:
-        stmt = (
-            update(AgentBlueprint)
-            .where(AgentBlueprint.id == agent_id)
-            .values(**update_data)
-        )
-        await db.execute(stmt)
-        await db.flush()
-        await db.refresh(agent)
+        after_commit(db, lambda: invalidate_agent_cache(agent_id))
+        after_commit(db, lambda: blueprint_cache.invalidate(agent_id))
+        after_commit(db, lambda: list_cache.invalidate("agents"))
+        # Commit before responding so the client's next read sees the write
+        await db.commit()
 
     return agent
 
@@ -251,7 +562,7 @@ async def update_agent_blueprint(
 async def delete_agent_blueprint(
     agent_id: int,
     hard_delete: bool = False,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_rw)
 ) -> None:
     """
     Delete an agent blueprint (soft delete by default).
@@ -264,28 +575,31 @@ async def delete_agent_blueprint(
     Raises:
         HTTPException: If agent not found
     """
-    query = select(AgentBlueprint).where(AgentBlueprint.id == agent_id)
-    result = await db.execute(query)
-    agent = result.scalar_one_or_none()
-
-    if not agent:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Agent blueprint {agent_id} not found"
-        )
-
     if hard_delete:
-        stmt = delete(AgentBlueprint).where(AgentBlueprint.id == agent_id)
-        await db.execute(stmt)
+        stmt = (
+            delete(AgentBlueprint)
+            .where(AgentBlueprint.id == agent_id)
+            .returning(AgentBlueprint.id)
+        )
     else:
         stmt = (
             update(AgentBlueprint)
             .where(AgentBlueprint.id == agent_id)
             .values(is_active=False)
+            .returning(AgentBlueprint.id)
         )
-        await db.execute(stmt)
 
-    await db.flush()
+    if (await db.execute(stmt)).scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Agent blueprint {agent_id} not found"
+        )
+
+    after_commit(db, lambda: invalidate_agent_cache(agent_id))
+    after_commit(db, lambda: blueprint_cache.invalidate(agent_id))
+    after_commit(db, lambda: list_cache.invalidate("agents"))
+    # Commit before responding so the client's next read sees the write
+    await db.commit()
 
 
 # ============================================================================
@@ -296,6 +610,7 @@ async def delete_agent_blueprint(
 async def chat_with_agent(
     agent_id: int,
     chat_request: ChatRequest,
+    request: Request,
     db: AsyncSession = Depends(get_db)
 ) -> StreamingResponse:
     """
@@ -307,6 +622,7 @@ async def chat_with_agent(
     Args:
         agent_id: Agent blueprint ID
         chat_request: User message and conversation history
+        request: Incoming request (for app-scoped clients)
         db: Database session
 
     Returns:
@@ -315,10 +631,8 @@ async def chat_with_agent(
     Raises:
         HTTPException: If agent not found
     """
-    # Fetch agent blueprint
-    query = select(AgentBlueprint).where(AgentBlueprint.id == agent_id)
-    result = await db.execute(query)
-    blueprint = result.scalar_one_or_none()
+    # Fetch agent blueprint (cached)
+    blueprint = await blueprint_cache.fetch(db, agent_id)
 
     if not blueprint:
         raise HTTPException(
@@ -335,49 +649,44 @@ async def chat_with_agent(
         has_trading_tools=blueprint.has_trading_tools
     )
 
-    # Prepare dependencies
+    # Prepare dependencies (shared clients are owned by the app lifespan)
     deps = AgentDependencies(
-        http_client=httpx.AsyncClient(timeout=60.0)
+        http_client=request.app.state.http_client
     )
 
     # Add trading context if enabled
     if blueprint.has_trading_tools:
-        from database import settings
         trading_ctx = TradingContext(
             exchange_id="binance",
             api_key=settings.exchange_api_key if settings.exchange_api_key else None,
             secret=settings.exchange_secret if settings.exchange_secret else None,
             testnet=True
         )
-        exchange = get_exchange(trading_ctx)
-        await exchange.load_markets()  # CRITICAL: Load markets before operations
-
         deps.trading_ctx = trading_ctx
-        deps.exchange = exchange
+        deps.exchange = await get_shared_exchange(request.app, trading_ctx)
 
     # Stream response
-    async def generate() -> AsyncIterator[str]:
-        """Generator for streaming response chunks."""
-        try:
-            async for chunk in run_agent_stream(agent, chat_request.message, deps):
-                yield chunk
-        finally:
-            # Cleanup
-            if deps.http_client:
-                await deps.http_client.aclose()
-            if deps.exchange:
-                await deps.exchange.close()
+    async def generate() -> AsyncIterator[bytes]:
+        """Generator for streaming response chunks (pre-encoded to bytes)."""
+        async for chunk in run_agent_stream(agent, chat_request.message, deps):
+            yield chunk.encode()
 
+    # identity encoding keeps GZipMiddleware from buffering the token stream
     return StreamingResponse(
         generate(),
-        media_type="text/plain"
+        media_type="text/plain",
+        headers={"Content-Encoding": "identity"}
     )
 
 
+# Health body is constant; serialize it once at import time
+HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "agentfactory-backend"})
+
+
 @app.get("/health")
-async def health_check() -> dict:
+async def health_check() -> Response:
     """Health check endpoint."""
-    return {"status": "healthy", "service": "agentfactory-backend"}
+    return Response(HEALTH_BODY, media_type="application/json")
 
 
 # ============================================================================
@@ -391,7 +700,7 @@ async def health_check() -> dict:
 )
 async def create_workflow(
     workflow: WorkflowCreate,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_rw)
 ) -> Workflow:
     """
     Create a new workflow.
@@ -403,10 +712,11 @@ async def create_workflow(
     Returns:
         Created workflow with ID
     """
-    db_workflow = Workflow(**workflow.model_dump())
-    db.add(db_workflow)
-    await db.flush()
-    await db.refresh(db_workflow)
+    stmt = insert(Workflow).values(**workflow.model_dump()).returning(Workflow)
+    db_workflow = (await db.execute(stmt)).scalar_one()
+    after_commit(db, lambda: list_cache.invalidate("workflows"))
+    # Commit before responding so the client's next read sees the write
+    await db.commit()
     return db_workflow
 
 
@@ -415,42 +725,53 @@ async def list_workflows(
     skip: int = 0,
     limit: int = 100,
     active_only: bool = True,
+    after_id: Optional[int] = None,
     db: AsyncSession = Depends(get_db)
-) -> dict:
+) -> Response:
     """
     List workflows with pagination.
 
     Args:
-        skip: Number of records to skip
+        skip: Number of records to skip (legacy; ignored when after_id is set)
         limit: Maximum number of records to return
         active_only: Filter for active workflows only
+        after_id: Keyset cursor; return workflows with a lower ID than this.
+            Omit it (with skip=0) for the first page, then pass next_cursor
         db: Database session
 
     Returns:
-        Paginated list of workflows
+        Paginated list of workflows with the next cursor
     """
-    query = select(Workflow)
+    async def build(session: AsyncSession) -> dict:
+        query = select(Workflow).options(*strict_load())
 
-    if active_only:
-        query = query.where(Workflow.is_active == True)
+        if active_only:
+            query = query.where(Workflow.is_active == True)
 
-    query = query.offset(skip).limit(limit).order_by(Workflow.created_at.desc())
+        # One ordering for both modes, so a cursor continues any page in sequence
+        query = query.order_by(Workflow.id.desc()).limit(limit)
+        if after_id is not None:
+            # Keyset pagination seeks on the primary key instead of scanning skipped rows
+            query = query.where(Workflow.id < after_id)
+        else:
+            query = query.offset(skip)
 
-    result = await db.execute(query)
-    workflows = result.scalars().all()
+        # Count total
+        count_query = select(func.count(Workflow.id))
+        if active_only:
+            count_query = count_query.where(Workflow.is_active == True)
 
-    # Count total
-    count_query = select(Workflow)
-    if active_only:
-        count_query = count_query.where(Workflow.is_active == True)
+        workflows, total = await fetch_page_and_total(session, query, count_query)
 
-    count_result = await db.execute(count_query)
-    total = len(count_result.scalars().all())
+        return {
+            "total": total,
+            "workflows": workflows,
+            # Offset pages (skip > 0) are legacy; only the first page and keyset pages carry a cursor
+            "next_cursor": next_cursor(workflows, limit) if after_id is not None or not skip else None
+        }
 
-    return {
-        "total": total,
-        "workflows": workflows
-    }
+    cache_key = (skip, limit, active_only, after_id)
+    return await serve_cached_list("workflows", cache_key, db, build, WorkflowList)
 
 
 @app.get("/workflows/{workflow_id}", response_model=WorkflowResponse)
@@ -459,7 +780,8 @@ async def get_workflow(
     db: AsyncSession = Depends(get_db)
 ) -> Workflow:
     """Get a specific workflow by ID."""
-    query = select(Workflow).where(Workflow.id == workflow_id)
+    # lambda_stmt caches the compiled statement; workflow_id becomes a bound parameter
+    query = lambda_stmt(lambda: select(Workflow).where(Workflow.id == workflow_id))
     result = await db.execute(query)
     workflow = result.scalar_one_or_none()
 
@@ -476,12 +798,21 @@ async def get_workflow(
 async def update_workflow(
     workflow_id: int,
     workflow_update: WorkflowUpdate,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_rw)
 ) -> Workflow:
     """Update an existing workflow."""
-    query = select(Workflow).where(Workflow.id == workflow_id)
-    result = await db.execute(query)
-    workflow = result.scalar_one_or_none()
+    # Update fields and fetch the row in a single round trip
+    update_data = workflow_update.model_dump(exclude_unset=True)
+    if update_data:
+        stmt = (
+            update(Workflow)
+            .where(Workflow.id == workflow_id)
+            .values(**update_data)
+            .returning(Workflow)
+        )
+        workflow = (await db.execute(stmt)).scalar_one_or_none()
+    else:
+        workflow = await db.get(Workflow, workflow_id)
 
     if not workflow:
         raise HTTPException(
@@ -489,17 +820,10 @@ async def update_workflow(
             detail=f"Workflow {workflow_id} not found"
         )
 
-    # Update fields
-    update_data = workflow_update.model_dump(exclude_unset=True)
     if update_data:
-        stmt = (
-            update(Workflow)
-            .where(Workflow.id == workflow_id)
-            .values(**update_data)
-        )
-        await db.execute(stmt)
-        await db.flush()
-        await db.refresh(workflow)
+        after_commit(db, lambda: list_cache.invalidate("workflows"))
+        # Commit before responding so the client's next read sees the write
+        await db.commit()
 
     return workflow
 
@@ -508,37 +832,64 @@ async def update_workflow(
 async def delete_workflow(
     workflow_id: int,
     hard_delete: bool = False,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_rw)
 ) -> None:
     """Delete a workflow (soft delete by default)."""
-    query = select(Workflow).where(Workflow.id == workflow_id)
-    result = await db.execute(query)
-    workflow = result.scalar_one_or_none()
-
-    if not workflow:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workflow {workflow_id} not found"
-        )
-
     if hard_delete:
-        stmt = delete(Workflow).where(Workflow.id == workflow_id)
-        await db.execute(stmt)
+        stmt = (
+            delete(Workflow)
+            .where(Workflow.id == workflow_id)
+            .returning(Workflow.id)
+        )
     else:
         stmt = (
             update(Workflow)
             .where(Workflow.id == workflow_id)
             .values(is_active=False)
+            .returning(Workflow.id)
         )
-        await db.execute(stmt)
 
-    await db.flush()
+    if (await db.execute(stmt)).scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Workflow {workflow_id} not found"
+        )
+
+    after_commit(db, lambda: list_cache.invalidate("workflows"))
+    # Commit before responding so the client's next read sees the write
+    await db.commit()
 
 
 # ============================================================================
 # Workflow Graph Management (Nodes & Edges)
 # ============================================================================
 
+async def touch_workflow(db: AsyncSession, workflow_id: int) -> None:
+    """
+    Verify a workflow exists and bump its updated_at after a graph change.
+
+    updated_at versions the graph (the orchestrator caches execution order
+    by it), so node and edge writes must advance it. The existence check
+    and the bump are a single UPDATE ... RETURNING. Callers commit
+    before responding once their own writes are done.
+
+    Raises:
+        HTTPException: If the workflow does not exist
+    """
+    stmt = (
+        update(Workflow)
+        .where(Workflow.id == workflow_id)
+        .values(updated_at=datetime.utcnow())
+        .returning(Workflow.id)
+    )
+    if (await db.execute(stmt)).scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Workflow {workflow_id} not found"
+        )
+    after_commit(db, lambda: list_cache.invalidate("workflows"))
+
+
 @app.post(
     "/workflows/{workflow_id}/nodes",
     response_model=WorkflowNodeResponse,
@@ -547,26 +898,50 @@ async def delete_workflow(
 async def create_workflow_node(
     workflow_id: int,
     node: WorkflowNodeCreate,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_rw)
 ) -> WorkflowNode:
     """Add a node to a workflow."""
-    # Verify workflow exists
-    workflow_query = select(Workflow).where(Workflow.id == workflow_id)
-    workflow_result = await db.execute(workflow_query)
-    if not workflow_result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workflow {workflow_id} not found"
-        )
+    await touch_workflow(db, workflow_id)
 
-    # Create node
-    db_node = WorkflowNode(**node.model_dump())
-    db.add(db_node)
-    await db.flush()
-    await db.refresh(db_node)
+    # Create node; the path workflow_id (the one touched above) wins over the body's
+    stmt = (
+        insert(WorkflowNode)
+        .values({**node.model_dump(), "workflow_id": workflow_id})
+        .returning(WorkflowNode)
+    )
+    db_node = (await db.execute(stmt)).scalar_one()
+    # Commit before responding so the client's next read sees the write
+    await db.commit()
     return db_node
 
 
+@app.post(
+    "/workflows/{workflow_id}/nodes/bulk",
+    response_model=list[WorkflowNodeResponse],
+    status_code=status.HTTP_201_CREATED
+)
+async def create_workflow_nodes_bulk(
+    workflow_id: int,
+    nodes: list[WorkflowNodeCreate],
+    db: AsyncSession = Depends(get_db_rw)
+) -> Sequence[WorkflowNode]:
+    """
+    Add many nodes to a workflow in one batched INSERT ... RETURNING.
+
+    The workflow_id in each body is replaced by the path parameter.
+    Nodes are returned in request order.
+    """
+    await touch_workflow(db, workflow_id)
+    created = []
+    if nodes:
+        rows = [{**node.model_dump(), "workflow_id": workflow_id} for node in nodes]
+        stmt = insert(WorkflowNode).returning(WorkflowNode, sort_by_parameter_order=True)
+        created = (await db.scalars(stmt, rows)).all()
+    # Commit before responding so the client's next read sees the write
+    await db.commit()
+    return created
+
+
 @app.delete(
     "/workflows/{workflow_id}/nodes/{node_id}",
     status_code=status.HTTP_204_NO_CONTENT
@@ -574,25 +949,27 @@ async def create_workflow_node(
 async def delete_workflow_node(
     workflow_id: int,
     node_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_rw)
 ) -> None:
     """Remove a node from a workflow."""
-    query = select(WorkflowNode).where(
-        WorkflowNode.id == node_id,
-        WorkflowNode.workflow_id == workflow_id
+    stmt = (
+        delete(WorkflowNode)
+        .where(
+            WorkflowNode.id == node_id,
+            WorkflowNode.workflow_id == workflow_id
+        )
+        .returning(WorkflowNode.id)
     )
-    result = await db.execute(query)
-    node = result.scalar_one_or_none()
 
-    if not node:
+    if (await db.execute(stmt)).scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Node {node_id} not found in workflow {workflow_id}"
         )
 
-    stmt = delete(WorkflowNode).where(WorkflowNode.id == node_id)
-    await db.execute(stmt)
-    await db.flush()
+    await touch_workflow(db, workflow_id)
+    # Commit before responding so the client's next read sees the write
+    await db.commit()
 
 
 @app.post(
@@ -603,26 +980,50 @@ async def delete_workflow_node(
 async def create_workflow_edge(
     workflow_id: int,
     edge: WorkflowEdgeCreate,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_rw)
 ) -> WorkflowEdge:
     """Add an edge (connection) to a workflow."""
-    # Verify workflow exists
-    workflow_query = select(Workflow).where(Workflow.id == workflow_id)
-    workflow_result = await db.execute(workflow_query)
-    if not workflow_result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Workflow {workflow_id} not found"
-        )
+    await touch_workflow(db, workflow_id)
 
-    # Create edge
-    db_edge = WorkflowEdge(**edge.model_dump())
-    db.add(db_edge)
-    await db.flush()
-    await db.refresh(db_edge)
+    # Create edge; the path workflow_id (the one touched above) wins over the body's
+    stmt = (
+        insert(WorkflowEdge)
+        .values({**edge.model_dump(), "workflow_id": workflow_id})
+        .returning(WorkflowEdge)
+    )
+    db_edge = (await db.execute(stmt)).scalar_one()
+    # Commit before responding so the client's next read sees the write
+    await db.commit()
     return db_edge
 
 
+@app.post(
+    "/workflows/{workflow_id}/edges/bulk",
+    response_model=list[WorkflowEdgeResponse],
+    status_code=status.HTTP_201_CREATED
+)
+async def create_workflow_edges_bulk(
+    workflow_id: int,
+    edges: list[WorkflowEdgeCreate],
+    db: AsyncSession = Depends(get_db_rw)
+) -> Sequence[WorkflowEdge]:
+    """
+    Add many edges to a workflow in one batched INSERT ... RETURNING.
+
+    The workflow_id in each body is replaced by the path parameter.
+    Edges are returned in request order.
+    """
+    await touch_workflow(db, workflow_id)
+    created = []
+    if edges:
+        rows = [{**edge.model_dump(), "workflow_id": workflow_id} for edge in edges]
+        stmt = insert(WorkflowEdge).returning(WorkflowEdge, sort_by_parameter_order=True)
+        created = (await db.scalars(stmt, rows)).all()
+    # Commit before responding so the client's next read sees the write
+    await db.commit()
+    return created
+
+
 @app.delete(
     "/workflows/{workflow_id}/edges/{edge_id}",
     status_code=status.HTTP_204_NO_CONTENT
@@ -630,55 +1031,66 @@ async def create_workflow_edge(
 async def delete_workflow_edge(
     workflow_id: int,
     edge_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_rw)
 ) -> None:
     """Remove an edge from a workflow."""
-    query = select(WorkflowEdge).where(
-        WorkflowEdge.id == edge_id,
-        WorkflowEdge.workflow_id == workflow_id
+    stmt = (
+        delete(WorkflowEdge)
+        .where(
+            WorkflowEdge.id == edge_id,
+            WorkflowEdge.workflow_id == workflow_id
+        )
+        .returning(WorkflowEdge.id)
     )
-    result = await db.execute(query)
-    edge = result.scalar_one_or_none()
 
-    if not edge:
+    if (await db.execute(stmt)).scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Edge {edge_id} not found in workflow {workflow_id}"
         )
 
-    stmt = delete(WorkflowEdge).where(WorkflowEdge.id == edge_id)
-    await db.execute(stmt)
-    await db.flush()
+    await touch_workflow(db, workflow_id)
+    # Commit before responding so the client's next read sees the write
+    await db.commit()
+
+
+# Graph reads select exactly the response fields from the tables
+_GRAPH_WORKFLOW_COLUMNS = [Workflow.__table__.c[name] for name in WorkflowResponse.model_fields]
+_GRAPH_NODE_COLUMNS = [WorkflowNode.__table__.c[name] for name in WorkflowNodeResponse.model_fields]
+_GRAPH_EDGE_COLUMNS = [WorkflowEdge.__table__.c[name] for name in WorkflowEdgeResponse.model_fields]
 
 
 @app.get("/workflows/{workflow_id}/graph", response_model=WorkflowGraphResponse)
 async def get_workflow_graph(
     workflow_id: int,
     db: AsyncSession = Depends(get_db)
-) -> dict:
-    """Get complete workflow structure (nodes + edges) for visualization."""
-    from sqlalchemy.orm import selectinload
-
-    # Load workflow with nodes and edges
-    query = select(Workflow).options(
-        selectinload(Workflow.nodes),
-        selectinload(Workflow.edges)
-    ).where(Workflow.id == workflow_id)
+) -> Response:
+    """
+    Get complete workflow structure (nodes + edges) for visualization.
 
-    result = await db.execute(query)
-    workflow = result.scalar_one_or_none()
+    Read-only, so rows come from Core selects and go straight into the
+    response models (model_construct; the data is already validated on
+    write), skipping ORM identity-map and instrumentation overhead.
+    """
+    workflow_query = select(*_GRAPH_WORKFLOW_COLUMNS).where(Workflow.id == workflow_id)
+    nodes_query = select(*_GRAPH_NODE_COLUMNS).where(WorkflowNode.workflow_id == workflow_id)
+    edges_query = select(*_GRAPH_EDGE_COLUMNS).where(WorkflowEdge.workflow_id == workflow_id)
 
+    workflow = (await db.execute(workflow_query)).mappings().one_or_none()
     if not workflow:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Workflow {workflow_id} not found"
         )
 
-    return {
-        "workflow": workflow,
-        "nodes": workflow.nodes,
-        "edges": workflow.edges
-    }
+    nodes = await stream_mappings(db, nodes_query)
+    edges = await stream_mappings(db, edges_query)
+
+    return model_response(WorkflowGraphResponse.model_construct(
+        workflow=WorkflowResponse.model_construct(**workflow),
+        nodes=[WorkflowNodeResponse.model_construct(**row) for row in nodes],
+        edges=[WorkflowEdgeResponse.model_construct(**row) for row in edges]
+    ))
 
 
 # ============================================================================
@@ -693,7 +1105,7 @@ async def get_workflow_graph(
 async def execute_workflow(
     workflow_id: int,
     execution_request: WorkflowExecutionRequest,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_rw)
 ) -> WorkflowExecution:
     """
     Start async workflow execution.
@@ -706,20 +1118,16 @@ async def execute_workflow(
         db: Database session
 
     Returns:
-        Execution record with PENDING/RUNNING status
+        Execution record with PENDING status
     """
-    orchestrator = WorkflowOrchestrator(db)
+    orchestrator = get_orchestrator()
 
     try:
-        execution_id = await orchestrator.execute_workflow(
+        execution, workflow = await orchestrator.create_execution(
+            db,
             workflow_id=workflow_id,
             initial_input=execution_request.initial_input
         )
-
-        # Fetch and return execution record
-        execution = await orchestrator.get_execution_status(execution_id)
-        return execution
-
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -731,6 +1139,16 @@ async def execute_workflow(
             detail=f"Workflow execution failed: {str(e)}"
         )
 
+    # CRITICAL: the background run opens its own session on the same engine
+    orchestrator.start_execution(
+        db.bind,
+        execution.id,
+        workflow,
+        execution_request.initial_input
+    )
+
+    return execution
+
 
 @app.get("/executions/{execution_id}", response_model=WorkflowExecutionResponse)
 async def get_execution_status(
@@ -738,10 +1156,10 @@ async def get_execution_status(
     db: AsyncSession = Depends(get_db)
 ) -> WorkflowExecution:
     """Get current status of a workflow execution."""
-    orchestrator = WorkflowOrchestrator(db)
+    orchestrator = get_orchestrator()
 
     try:
-        execution = await orchestrator.get_execution_status(execution_id)
+        execution = await orchestrator.get_execution_status(db, execution_id)
         return execution
     except ValueError as e:
         raise HTTPException(
@@ -750,31 +1168,84 @@ async def get_execution_status(
         )
 
 
+# Default page size for execution logs
+LOG_PAGE_SIZE = 200
+
+
 @app.get(
     "/executions/{execution_id}/logs",
     response_model=WorkflowExecutionDetailResponse
 )
 async def get_execution_logs(
     execution_id: int,
+    after_id: Optional[int] = None,
+    limit: int = LOG_PAGE_SIZE,
     db: AsyncSession = Depends(get_db)
-) -> dict:
-    """Get detailed execution logs for debugging and monitoring."""
-    orchestrator = WorkflowOrchestrator(db)
+) -> Response:
+    """
+    Get a page of execution logs for debugging and monitoring.
+
+    Args:
+        execution_id: Execution to read
+        after_id: Keyset cursor; return logs with a higher ID than this
+        limit: Maximum number of logs to return
+        db: Database session
+
+    Returns:
+        Execution status, a page of logs (oldest first) and the next cursor
+    """
+    orchestrator = get_orchestrator()
 
     try:
-        execution = await orchestrator.get_execution_status(execution_id)
-        logs = await orchestrator.get_execution_logs(execution_id)
+        # One session, one pooled connection; a missing execution 404s before the log query
+        execution = await orchestrator.get_execution_status(db, execution_id)
+        logs = await orchestrator.get_execution_logs(db, execution_id, after_id, limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
 
-        return {
-            "execution": execution,
-            "logs": logs
-        }
+    # Rows come straight from the database; skip per-log validation
+    detail = WorkflowExecutionDetailResponse.model_construct(
+        execution=WorkflowExecutionResponse.from_orm_fast(execution),
+        logs=[WorkflowExecutionLogResponse.from_orm_fast(log) for log in logs],
+        next_cursor=next_cursor(logs, limit)
+    )
+    return model_response(detail)
+
+
+@app.get("/executions/{execution_id}/logs/stream")
+async def stream_execution_logs(
+    execution_id: int,
+    db: AsyncSession = Depends(get_db)
+) -> StreamingResponse:
+    """
+    Stream every log of an execution as NDJSON, one log object per line.
+
+    Rows are read from a server-side cursor and written as they arrive,
+    so long executions are never buffered in memory.
+    """
+    orchestrator = get_orchestrator()
+
+    try:
+        await orchestrator.get_execution_status(db, execution_id)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
 
+    # The request session closes before the body is sent; stream on our own
+    bind = db.bind
+
+    async def generate() -> AsyncIterator[bytes]:
+        async with AsyncSession(bind) as stream_db:
+            async for log in orchestrator.stream_execution_logs(stream_db, execution_id):
+                yield WorkflowExecutionLogResponse.from_orm_fast(log).model_dump_json().encode() + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
 
 # ============================================================================
 # Research Assistant Endpoints
@@ -891,7 +1362,7 @@ async def format_citation_endpoint(request: CitationRequest) -> CitationResponse
 )
 async def save_citation(
     citation: SavedCitationCreate,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_rw)
 ) -> SavedCitation:
     """
     Save a citation to the database.
@@ -905,6 +1376,8 @@ async def save_citation(
     """
     db_citation = SavedCitation(
         paper_data=citation.paper_data.model_dump(),
+        doi=citation.paper_data.doi,
+        title=citation.paper_data.title[:512],
         format=citation.format.value,
         notes=citation.notes
     )
@@ -931,7 +1404,7 @@ async def list_saved_citations(
     Returns:
         List of saved citations
     """
-    query = select(SavedCitation).offset(skip).limit(limit).order_by(SavedCitation.created_at.desc())
+    query = select(SavedCitation).options(*strict_load()).offset(skip).limit(limit).order_by(SavedCitation.created_at.desc())
     result = await db.execute(query)
     citations = result.scalars().all()
     return list(citations)
@@ -952,7 +1425,7 @@ async def get_saved_citation(
     Returns:
         Saved citation details
     """
-    query = select(SavedCitation).where(SavedCitation.id == citation_id)
+    query = lambda_stmt(lambda: select(SavedCitation).where(SavedCitation.id == citation_id))
     result = await db.execute(query)
     citation = result.scalar_one_or_none()
 
@@ -968,7 +1441,7 @@ async def get_saved_citation(
 @app.delete("/research/citations/{citation_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_saved_citation(
     citation_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_rw)
 ) -> None:
     """
     Delete a saved citation.
@@ -977,20 +1450,14 @@ async def delete_saved_citation(
         citation_id: ID of the citation to delete
         db: Database session
     """
-    query = select(SavedCitation).where(SavedCitation.id == citation_id)
-    result = await db.execute(query)
-    citation = result.scalar_one_or_none()
+    stmt = delete(SavedCitation).where(SavedCitation.id == citation_id).returning(SavedCitation.id)
 
-    if not citation:
+    if (await db.execute(stmt)).scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Citation {citation_id} not found"
         )
 
-    stmt = delete(SavedCitation).where(SavedCitation.id == citation_id)
-    await db.execute(stmt)
-    await db.flush()
-
 
 if __name__ == "__main__":
     import uvicorn
@@ -998,5 +1465,6 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        reload=True,
+        loop="uvloop"
     )
@@ -0,0 +1,210 @@
+"""
+Versioned schema migrations for existing Postgres databases.
+Run once per deploy, before the app starts: python migrate.py
+"""
+from dataclasses import dataclass
+import asyncio
+import logging
+from sqlalchemy import text
+from database import Base, engine
+import models  # noqa: F401  (registers tables on Base.metadata)
+import workflow_models  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    A numbered schema change, applied at most once per database.
+
+    Statements must be safe on a database that create_all already built
+    with the current models (guard rewrites, use IF NOT EXISTS).
+    Non-transactional migrations run statement by statement in
+    autocommit mode, as CREATE INDEX CONCURRENTLY requires.
+    """
+    version: str
+    statements: tuple[str, ...]
+    transactional: bool = True
+
+
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(
+        "0001_citation_lookup_columns",
+        (
+            "ALTER TABLE saved_citations ADD COLUMN IF NOT EXISTS doi VARCHAR(128)",
+            "ALTER TABLE saved_citations ADD COLUMN IF NOT EXISTS title VARCHAR(512)",
+            """
+            UPDATE saved_citations
+            SET doi = left(paper_data->>'doi', 128), title = left(paper_data->>'title', 512)
+            WHERE doi IS NULL AND title IS NULL
+            """,
+        ),
+    ),
+    Migration(
+        # Rewrites the table; runs only while the column is still json
+        "0002_citation_paper_data_jsonb",
+        (
+            """
+            DO $$
+            BEGIN
+                IF (SELECT data_type FROM information_schema.columns
+                    WHERE table_name = 'saved_citations' AND column_name = 'paper_data') = 'json' THEN
+                    ALTER TABLE saved_citations
+                        ALTER COLUMN paper_data TYPE jsonb USING paper_data::jsonb;
+                END IF;
+            END $$
+            """,
+        ),
+    ),
+    Migration(
+        # Naive timestamps were written as UTC; convert only while still naive
+        "0003_timestamptz_server_defaults",
+        tuple(
+            f"""
+            DO $$
+            BEGIN
+                IF (SELECT data_type FROM information_schema.columns
+                    WHERE table_name = '{table}' AND column_name = '{column}')
+                    = 'timestamp without time zone' THEN
+                    ALTER TABLE {table}
+                        ALTER COLUMN {column} TYPE timestamptz USING {column} AT TIME ZONE 'UTC';
+                END IF;
+                ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT now();
+            END $$
+            """
+            for table, column in (
+                ("agent_blueprints", "created_at"),
+                ("agent_blueprints", "updated_at"),
+                ("saved_citations", "created_at"),
+                ("node_execution_cache", "created_at"),
+            )
+        ),
+    ),
+    Migration(
+        # Enum columns stored member names before ShortEnum; rewrite only while still wide
+        "0004_short_enum_codes",
+        (
+            """
+            DO $$
+            BEGIN
+                IF (SELECT character_maximum_length FROM information_schema.columns
+                    WHERE table_name = 'workflow_executions' AND column_name = 'status') > 1 THEN
+                    -- Its predicate names the old values; 0005 rebuilds it
+                    DROP INDEX IF EXISTS idx_execution_active_started;
+                    UPDATE workflow_executions SET status = CASE status
+                        WHEN 'PENDING' THEN 'P' WHEN 'RUNNING' THEN 'R' WHEN 'COMPLETED' THEN 'C'
+                        WHEN 'FAILED' THEN 'F' WHEN 'CANCELLED' THEN 'X' END
+                    WHERE status IN ('PENDING', 'RUNNING', 'COMPLETED', 'FAILED', 'CANCELLED');
+                    ALTER TABLE workflow_executions ALTER COLUMN status TYPE VARCHAR(1);
+                END IF;
+                IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'ck_workflow_execution_status') THEN
+                    ALTER TABLE workflow_executions ADD CONSTRAINT ck_workflow_execution_status
+                        CHECK (status IN ('P', 'R', 'C', 'F', 'X'));
+                END IF;
+            END $$
+            """,
+            """
+            DO $$
+            BEGIN
+                IF (SELECT character_maximum_length FROM information_schema.columns
+                    WHERE table_name = 'workflow_nodes' AND column_name = 'node_type') > 1 THEN
+                    UPDATE workflow_nodes SET node_type = CASE node_type
+                        WHEN 'AGENT' THEN 'A' WHEN 'CONDITION' THEN 'C' WHEN 'START' THEN 'S'
+                        WHEN 'END' THEN 'E' END
+                    WHERE node_type IN ('AGENT', 'CONDITION', 'START', 'END');
+                    ALTER TABLE workflow_nodes ALTER COLUMN node_type TYPE VARCHAR(1);
+                END IF;
+                IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'ck_workflow_node_type') THEN
+                    ALTER TABLE workflow_nodes ADD CONSTRAINT ck_workflow_node_type
+                        CHECK (node_type IN ('A', 'C', 'S', 'E'));
+                END IF;
+            END $$
+            """,
+        ),
+    ),
+    Migration(
+        # Indexes added to models after their tables existed; built without blocking writes
+        "0005_concurrent_indexes",
+        (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_agent_active_id ON agent_blueprints (is_active, id)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_workflow_active_id ON workflows (is_active, id)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_saved_citations_doi ON saved_citations (doi)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_saved_citations_title ON saved_citations (title)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_citation_paper_data_gin "
+            "ON saved_citations USING gin (paper_data)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_edge_source_node ON workflow_edges (source_node_id)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_edge_target_node ON workflow_edges (target_node_id)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_execution_workflow_status_started "
+            "ON workflow_executions (workflow_id, status, started_at)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_execution_workflow_started "
+            "ON workflow_executions (workflow_id, started_at)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_execution_active_started "
+            "ON workflow_executions (started_at) WHERE status IN ('P', 'R')",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_node_execution_cache_created_at "
+            "ON node_execution_cache (created_at)",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_execution_log_execution_id "
+            "ON workflow_execution_logs (execution_id, id)",
+        ),
+        transactional=False,
+    ),
+)
+
+# Session-level advisory lock key; serializes concurrent runners
+_LOCK_KEY = 0x4146_4D47  # "AFMG"
+
+
+async def _apply(migration: Migration) -> None:
+    """Run one migration's statements and record its version."""
+    record = text("INSERT INTO schema_migrations (version) VALUES (:version)")
+    if migration.transactional:
+        async with engine.begin() as conn:
+            for statement in migration.statements:
+                await conn.exec_driver_sql(statement)
+            await conn.execute(record, {"version": migration.version})
+        return
+
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for statement in migration.statements:
+            await conn.exec_driver_sql(statement)
+        await conn.execute(record, {"version": migration.version})
+
+
+async def migrate() -> None:
+    """
+    Create missing tables, then apply pending migrations in version order.
+
+    Raises:
+        RuntimeError: If the database is not Postgres
+    """
+    if engine.dialect.name != "postgresql":
+        raise RuntimeError("Migrations target Postgres; other databases are built by create_all")
+
+    async with engine.connect() as lock_conn:
+        lock_conn = await lock_conn.execution_options(isolation_level="AUTOCOMMIT")
+        await lock_conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": _LOCK_KEY})
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+                await conn.exec_driver_sql(
+                    "CREATE TABLE IF NOT EXISTS schema_migrations ("
+                    "version VARCHAR(64) PRIMARY KEY, "
+                    "applied_at TIMESTAMPTZ NOT NULL DEFAULT now())"
+                )
+                applied = set((await conn.execute(text("SELECT version FROM schema_migrations"))).scalars())
+
+            for migration in MIGRATIONS:
+                if migration.version in applied:
+                    continue
+                logger.info(f"Applying migration {migration.version}")
+                await _apply(migration)
+        finally:
+            await lock_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _LOCK_KEY})
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(migrate())
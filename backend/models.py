@@ -4,7 +4,8 @@ Defines the agent blueprint schema with async operations support.
 """
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Float, Text, DateTime, Boolean, JSON
+from sqlalchemy import String, Float, Text, DateTime, Boolean, JSON, Index, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 from database import Base
 
@@ -26,6 +27,10 @@ class AgentBlueprint(Base):
         is_active: Soft delete flag
     """
     __tablename__ = "agent_blueprints"
+    __table_args__ = (
+        # Serves "WHERE is_active ORDER BY id DESC" list queries
+        Index("idx_agent_active_id", "is_active", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
@@ -35,16 +40,16 @@ class AgentBlueprint(Base):
     has_trading_tools: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     max_retries: Mapped[int] = mapped_column(default=0, nullable=False)
 
-    # Metadata
+    # Metadata (timestamps come from the database clock)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
-        default=datetime.utcnow,
+        DateTime(timezone=True),
+        server_default=func.now(),
         nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
@@ -59,24 +64,35 @@ class SavedCitation(Base):
 
     Attributes:
         id: Primary key
-        paper_data: JSON storage of PaperResult data
+        paper_data: JSON storage of PaperResult data (JSONB on Postgres)
+        doi: Paper DOI, copied from paper_data for indexed lookups
+        title: Paper title, copied from paper_data for indexed lookups
         format: Preferred citation format (bibtex, apa, mla, chicago)
         notes: User notes about the paper
         created_at: Timestamp of citation save
     """
     __tablename__ = "saved_citations"
+    __table_args__ = (
+        # Containment queries on paper_data (Postgres only)
+        Index("idx_citation_paper_data_gin", "paper_data", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    paper_data: Mapped[dict] = mapped_column(JSON, nullable=False)
+    paper_data: Mapped[dict] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"),
+        nullable=False
+    )
+    doi: Mapped[Optional[str]] = mapped_column(String(128), nullable=True, index=True)
+    title: Mapped[Optional[str]] = mapped_column(String(512), nullable=True, index=True)
     format: Mapped[str] = mapped_column(String(50), default="bibtex", nullable=False)
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
-        default=datetime.utcnow,
+        DateTime(timezone=True),
+        server_default=func.now(),
         nullable=False
     )
 
     def __repr__(self) -> str:
-        title = self.paper_data.get("title", "Unknown")[:50]
+        title = (self.title or self.paper_data.get("title", "Unknown"))[:50]
         return f"<SavedCitation(id={self.id}, title='{title}...')>"
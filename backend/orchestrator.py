@@ -2,14 +2,17 @@
 Workflow orchestration engine.
 Executes workflows as DAGs with topological sorting and state management.
 """
-from typing import Any, Optional
-from datetime import datetime
-from collections import deque, defaultdict
+from typing import Any, AsyncIterator, Optional, Sequence
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import asyncio
+import hashlib
 import logging
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, insert, update, delete, lambda_stmt
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload, joinedload, raiseload
+from cachetools import LRUCache
 
 from workflow_models import (
     Workflow,
@@ -18,7 +21,8 @@ from workflow_models import (
     WorkflowExecution,
     WorkflowExecutionLog,
     WorkflowStatus,
-    NodeType
+    NodeType,
+    NodeExecutionCache
 )
 from models import AgentBlueprint
 from delegation import (
@@ -41,23 +45,45 @@ class WorkflowExecutionError(Exception):
     pass
 
 
+# Concurrent nodes per execution (agent nodes are network-bound LLM calls)
+MAX_PARALLEL_NODES = 4
+
+# (workflow_id, updated_at) -> (parent IDs per node, node IDs per wave).
+# Node/edge writes bump Workflow.updated_at, so a changed graph misses.
+_plan_cache: LRUCache = LRUCache(maxsize=512)
+
+# Memoized node outputs older than this are re-run, and pruned on the next store
+NODE_CACHE_TTL = timedelta(days=7)
+
+# Log rows fetched per batch when streaming execution logs
+LOG_STREAM_BATCH_SIZE = 500
+
+# Detached execution tasks, kept alive until done and drained at shutdown
+_background_runs: set[asyncio.Task] = set()
+
+
 class WorkflowOrchestrator:
     """
     Orchestrates workflow execution with DAG validation and state management.
-    """
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
+    Holds no per-request state; every method takes the database session
+    it should use, so one instance is shared for the process lifetime.
+    """
 
     async def execute_workflow(
         self,
+        db: AsyncSession,
         workflow_id: int,
         initial_input: dict[str, Any]
     ) -> int:
         """
         Execute a workflow asynchronously.
 
+        The background run uses its own session bound to the same engine,
+        since the request session is closed once the response is sent.
+
         Args:
+            db: Request database session
             workflow_id: ID of workflow to execute
             initial_input: Initial data/message for workflow
 
@@ -68,8 +94,38 @@ class WorkflowOrchestrator:
             DAGValidationError: If workflow structure is invalid
             WorkflowExecutionError: If execution fails
         """
+        execution, workflow = await self.create_execution(db, workflow_id, initial_input)
+
+        # Execute workflow in background on its own session (never the request's)
+        self.start_execution(db.bind, execution.id, workflow, initial_input)
+
+        return execution.id
+
+    async def create_execution(
+        self,
+        db: AsyncSession,
+        workflow_id: int,
+        initial_input: dict[str, Any]
+    ) -> tuple[WorkflowExecution, Workflow]:
+        """
+        Create and commit a PENDING execution record without running it.
+
+        Every response field is set client-side, so the returned record
+        is complete without a refresh.
+
+        Args:
+            db: Request database session
+            workflow_id: ID of workflow to execute
+            initial_input: Initial data/message for workflow
+
+        Returns:
+            Tuple of (execution record, workflow with nodes and edges)
+
+        Raises:
+            ValueError: If the workflow does not exist or is inactive
+        """
         # Load workflow with nodes and edges
-        workflow = await self._load_workflow(workflow_id)
+        workflow = await self._load_workflow(db, workflow_id)
 
         # Create execution record
         execution = WorkflowExecution(
@@ -78,32 +134,39 @@ class WorkflowOrchestrator:
             initial_input=initial_input,
             started_at=datetime.utcnow()
         )
-        self.db.add(execution)
-        await self.db.commit()
-        await self.db.refresh(execution)
+        db.add(execution)
+        # Commit now so the background run can see the row
+        await db.commit()
 
         logger.info(f"Created execution {execution.id} for workflow {workflow_id}")
 
-        # Execute workflow in background (async task)
-        asyncio.create_task(
-            self._run_workflow_async(execution.id, workflow, initial_input)
-        )
+        return execution, workflow
 
-        return execution.id
+    async def _load_workflow(self, db: AsyncSession, workflow_id: int) -> Workflow:
+        """
+        Load workflow with all nodes and edges.
 
-    async def _load_workflow(self, workflow_id: int) -> Workflow:
-        """Load workflow with all nodes and edges."""
-        result = await self.db.execute(
-            select(Workflow)
+        One-to-many collections use selectinload; the many-to-one node
+        agent is joined into the nodes query. Every other relationship is
+        raiseload so a stray lazy load fails loudly instead of blocking.
+        """
+        # lambda_stmt caches the constructed statement; workflow_id becomes a bound parameter
+        query = lambda_stmt(
+            lambda: select(Workflow)
             .options(
-                selectinload(Workflow.nodes).selectinload(WorkflowNode.agent),
-                selectinload(Workflow.edges)
+                selectinload(Workflow.nodes).options(
+                    joinedload(WorkflowNode.agent),
+                    raiseload("*")
+                ),
+                selectinload(Workflow.edges).raiseload("*"),
+                raiseload("*")
             )
             .where(
                 Workflow.id == workflow_id,
                 Workflow.is_active == True
             )
         )
+        result = await db.execute(query)
         workflow = result.scalar_one_or_none()
 
         if not workflow:
@@ -111,8 +174,42 @@ class WorkflowOrchestrator:
 
         return workflow
 
-    async def _run_workflow_async(
+    def start_execution(
+        self,
+        bind: Any,
+        execution_id: int,
+        workflow: Workflow,
+        initial_input: dict[str, Any]
+    ) -> asyncio.Task:
+        """
+        Start run_execution as a supervised background task.
+
+        The task is referenced until it finishes, so it cannot be garbage
+        collected mid-run, and drain() waits for it at shutdown.
+        """
+        task = asyncio.create_task(
+            self.run_execution(bind, execution_id, workflow, initial_input)
+        )
+        _background_runs.add(task)
+        task.add_done_callback(_background_runs.discard)
+        return task
+
+    async def drain(self, timeout: float = 30.0) -> None:
+        """
+        Wait for in-flight executions, cancelling any still running after timeout.
+        Called during app shutdown, before the engine is disposed.
+        """
+        tasks = set(_background_runs)
+        if not tasks:
+            return
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run_execution(
         self,
+        bind: Any,
         execution_id: int,
         workflow: Workflow,
         initial_input: dict[str, Any]
@@ -120,59 +217,188 @@ class WorkflowOrchestrator:
         """
         Run workflow execution in background.
         Updates execution status in database.
+
+        Never pass the request session here; a fresh session is opened on
+        the given engine/connection bind.
         """
+        async with AsyncSession(bind, expire_on_commit=False) as db:
+            try:
+                await self._run_workflow(db, execution_id, workflow, initial_input)
+            except asyncio.CancelledError:
+                # Don't leave the execution stuck in RUNNING
+                await db.rollback()
+                await self._update_execution_status(
+                    db,
+                    execution_id,
+                    WorkflowStatus.FAILED,
+                    error_message="Execution cancelled"
+                )
+                raise
+
+    async def _run_workflow(
+        self,
+        db: AsyncSession,
+        execution_id: int,
+        workflow: Workflow,
+        initial_input: dict[str, Any]
+    ) -> None:
+        """
+        Execute workflow nodes in order on the given session.
+
+        Node logs are buffered in memory and written together with the
+        final status in one commit, instead of one commit per node.
+        """
+        pending_logs: list[dict[str, Any]] = []
+
         try:
             # Update status to RUNNING
-            await self._update_execution_status(execution_id, WorkflowStatus.RUNNING)
+            await self._update_execution_status(db, execution_id, WorkflowStatus.RUNNING)
 
-            # Validate DAG structure
-            execution_order = self._topological_sort(workflow)
+            # Validate DAG structure and group nodes into waves
+            parents, waves = self._execution_plan(workflow)
 
             # Initialize delegation context
             delegation_ctx = DelegationContext(
-                db_session=self.db,
-                available_agents=await get_available_agents(self.db)
+                db_session=db,
+                available_agents=await get_available_agents(db)
             )
 
-            # Execute nodes in topological order
+            # Execute nodes wave by wave; nodes in a wave are independent
             shared_context = {"initial_input": initial_input}
             final_output = None
-
-            for node in execution_order:
-                logger.info(f"Executing node {node.id} ({node.name})")
-
-                node_output = await self._execute_node(
-                    node=node,
-                    context=shared_context,
-                    delegation_ctx=delegation_ctx,
-                    execution_id=execution_id
-                )
-
-                # Update shared context with node output
-                shared_context[f"node_{node.id}_output"] = node_output
-                shared_context["last_output"] = node_output
-
-                # If this is an END node, capture final output
-                if node.node_type == NodeType.END:
-                    final_output = node_output
+            semaphore = asyncio.Semaphore(MAX_PARALLEL_NODES)
+
+            async def run_node(node: WorkflowNode) -> dict[str, Any]:
+                # Each node sees its own latest parent as last_output
+                context = dict(shared_context)
+                if parents[node.id]:
+                    context["last_output"] = shared_context[f"node_{parents[node.id][-1]}_output"]
+
+                async with semaphore:
+                    logger.info(f"Executing node {node.id} ({node.name})")
+                    return await self._execute_node(
+                        node=node,
+                        context=context,
+                        delegation_ctx=delegation_ctx,
+                        execution_id=execution_id,
+                        pending_logs=pending_logs,
+                        parent_ids=parents[node.id],
+                        db_bind=db.bind
+                    )
+
+            for wave in waves:
+                if len(wave) == 1:
+                    outputs = [await run_node(wave[0])]
+                else:
+                    try:
+                        async with asyncio.TaskGroup() as tg:
+                            tasks = [tg.create_task(run_node(node)) for node in wave]
+                    except ExceptionGroup as eg:
+                        raise eg.exceptions[0]
+                    outputs = [task.result() for task in tasks]
+
+                # Merge outputs in topological order
+                for node, node_output in zip(wave, outputs):
+                    shared_context[f"node_{node.id}_output"] = node_output
+                    shared_context["last_output"] = node_output
+
+                    # If this is an END node, capture final output
+                    if node.node_type == NodeType.END:
+                        final_output = node_output
 
             # Mark execution as completed
             await self._update_execution_status(
+                db,
                 execution_id,
                 WorkflowStatus.COMPLETED,
-                final_output=final_output or shared_context
+                final_output={
+                    **(final_output or shared_context),
+                    "delegation_history": delegation_ctx.delegation_history
+                },
+                logs=pending_logs
             )
 
             logger.info(f"Workflow execution {execution_id} completed successfully")
 
         except Exception as e:
             logger.error(f"Workflow execution {execution_id} failed: {str(e)}")
+            # Discard any half-done transaction; buffered logs live in memory
+            await db.rollback()
             await self._update_execution_status(
+                db,
                 execution_id,
                 WorkflowStatus.FAILED,
-                error_message=str(e)
+                error_message=str(e),
+                logs=pending_logs
             )
 
+    def _execution_plan(
+        self,
+        workflow: Workflow
+    ) -> tuple[dict[int, list[int]], list[list[WorkflowNode]]]:
+        """
+        Return each node's parent IDs and the waves of nodes to execute.
+
+        The graph work (sort, parents, waves) is cached per
+        (workflow.id, workflow.updated_at), so repeated executions of an
+        unchanged workflow only map cached IDs back to the loaded nodes.
+
+        Raises:
+            DAGValidationError: If graph has cycles or is invalid
+        """
+        nodes_map = {node.id: node for node in workflow.nodes}
+
+        cache_key = (workflow.id, workflow.updated_at)
+        cached = _plan_cache.get(cache_key)
+        if cached is not None and cached[0].keys() == nodes_map.keys():
+            parents, wave_ids = cached
+            return parents, [[nodes_map[nid] for nid in wave] for wave in wave_ids]
+
+        execution_order = self._topological_sort(workflow)
+        parents = self._parents_in_order(workflow, execution_order)
+        waves = self._waves(execution_order, parents)
+
+        _plan_cache[cache_key] = (
+            parents,
+            tuple(tuple(node.id for node in wave) for wave in waves)
+        )
+        return parents, waves
+
+    @staticmethod
+    def _parents_in_order(
+        workflow: Workflow,
+        execution_order: list[WorkflowNode]
+    ) -> dict[int, list[int]]:
+        """Map each node ID to its parent IDs, sorted by execution order."""
+        position = {node.id: i for i, node in enumerate(execution_order)}
+        parents: dict[int, list[int]] = {node.id: [] for node in execution_order}
+        for edge in workflow.edges:
+            parents[edge.target_node_id].append(edge.source_node_id)
+        for parent_ids in parents.values():
+            parent_ids.sort(key=position.__getitem__)
+        return parents
+
+    @staticmethod
+    def _waves(
+        execution_order: list[WorkflowNode],
+        parents: dict[int, list[int]]
+    ) -> list[list[WorkflowNode]]:
+        """
+        Group topologically sorted nodes into waves of independent nodes.
+
+        A node's wave is one past the deepest wave among its parents, so
+        every node runs after all of its inputs are available.
+        """
+        level: dict[int, int] = {}
+        waves: list[list[WorkflowNode]] = []
+        for node in execution_order:
+            depth = 1 + max((level[p] for p in parents[node.id]), default=-1)
+            level[node.id] = depth
+            if depth == len(waves):
+                waves.append([])
+            waves[depth].append(node)
+        return waves
+
     def _topological_sort(self, workflow: Workflow) -> list[WorkflowNode]:
         """
         Perform topological sort on workflow nodes.
@@ -181,49 +407,58 @@ class WorkflowOrchestrator:
         Raises:
             DAGValidationError: If graph has cycles or is invalid
         """
-        # Build adjacency list and in-degree map
-        adj_list = defaultdict(list)
-        in_degree = defaultdict(int)
-        nodes_map = {node.id: node for node in workflow.nodes}
-
-        # Initialize all nodes with in-degree 0
-        for node in workflow.nodes:
-            if node.id not in in_degree:
-                in_degree[node.id] = 0
+        # Reindex node IDs to 0..n-1 so the hot loop works on flat lists
+        nodes = workflow.nodes
+        n = len(nodes)
+        id_to_idx = {node.id: i for i, node in enumerate(nodes)}
+        adj: list[list[int]] = [[] for _ in range(n)]
+        in_degree = [0] * n
 
         # Build graph from edges
         for edge in workflow.edges:
-            adj_list[edge.source_node_id].append(edge.target_node_id)
-            in_degree[edge.target_node_id] += 1
+            try:
+                src = id_to_idx[edge.source_node_id]
+                dst = id_to_idx[edge.target_node_id]
+            except KeyError:
+                raise DAGValidationError(
+                    f"Edge {edge.id} references a node outside workflow {workflow.id}"
+                )
+            adj[src].append(dst)
+            in_degree[dst] += 1
 
         # Find START nodes (in-degree 0 or explicitly marked as START)
-        queue = deque()
-        for node in workflow.nodes:
-            if node.node_type == NodeType.START or in_degree[node.id] == 0:
-                queue.append(node.id)
+        queue = [
+            i for i, node in enumerate(nodes)
+            if node.node_type == NodeType.START or in_degree[i] == 0
+        ]
 
         if not queue:
-            raise DAGValidationError("No START node found in workflow")
+            # With nodes present, every node has a parent: the graph is cyclic
+            detail = ": every node is part of a cycle" if n else ""
+            raise DAGValidationError(f"No START node found in workflow{detail}")
 
-        # Kahn's algorithm for topological sort
-        sorted_nodes = []
-        while queue:
-            node_id = queue.popleft()
-            sorted_nodes.append(nodes_map[node_id])
+        # Kahn's algorithm; a list with a head index serves as the FIFO
+        head = 0
+        while head < len(queue):
+            idx = queue[head]
+            head += 1
 
             # Reduce in-degree for neighbors
-            for neighbor_id in adj_list[node_id]:
-                in_degree[neighbor_id] -= 1
-                if in_degree[neighbor_id] == 0:
-                    queue.append(neighbor_id)
-
-        # Check for cycles
-        if len(sorted_nodes) != len(workflow.nodes):
+            for neighbor in adj[idx]:
+                in_degree[neighbor] -= 1
+                if in_degree[neighbor] == 0:
+                    queue.append(neighbor)
+
+        # Check for cycles; nodes never dequeued still have unmet parents
+        if head != n:
+            stuck = sorted(nodes[i].id for i in range(n) if in_degree[i] > 0)
             raise DAGValidationError(
                 "Workflow contains cycles or unreachable nodes. "
-                f"Expected {len(workflow.nodes)} nodes, got {len(sorted_nodes)}"
+                f"Expected {n} nodes, got {head}; unresolved node IDs: {stuck}"
             )
 
+        sorted_nodes = [nodes[i] for i in queue]
+
         logger.info(
             f"Topological sort complete: {[n.name for n in sorted_nodes]}"
         )
@@ -235,7 +470,10 @@ class WorkflowOrchestrator:
         node: WorkflowNode,
         context: dict[str, Any],
         delegation_ctx: DelegationContext,
-        execution_id: int
+        execution_id: int,
+        pending_logs: list[dict[str, Any]],
+        parent_ids: Sequence[int] = (),
+        db_bind: Any = None
     ) -> dict[str, Any]:
         """
         Execute a single workflow node.
@@ -245,17 +483,28 @@ class WorkflowOrchestrator:
             context: Shared context from previous nodes
             delegation_ctx: Delegation context for agent calls
             execution_id: Execution ID for logging
+            pending_logs: Buffer the node's log row (column dict) is appended to
+            parent_ids: IDs of the node's parents, in execution order
+            db_bind: Engine/connection for the node output cache
 
         Returns:
             Node output (merged into shared context)
         """
-        log_entry = WorkflowExecutionLog(
-            execution_id=execution_id,
-            node_id=node.id,
-            agent_id=node.agent_id,
-            input_data=context.copy(),
-            timestamp=datetime.utcnow()
-        )
+        # Log only what this node received; parent outputs are in their own rows
+        # Every row carries the same keys so the buffer inserts as one executemany
+        log_entry = {
+            "execution_id": execution_id,
+            "node_id": node.id,
+            "agent_id": node.agent_id,
+            "input_data": {
+                "message": self._node_message(context),
+                "parents": list(parent_ids)
+            },
+            "output_data": None,
+            "error_message": None,
+            "is_delegation": False,
+            "timestamp": datetime.utcnow()
+        }
 
         try:
             if node.node_type == NodeType.START:
@@ -266,7 +515,7 @@ class WorkflowOrchestrator:
                 # END node aggregates final output
                 output = {
                     "final_result": context.get("last_output"),
-                    "full_context": context
+                    "execution_id": execution_id
                 }
 
             elif node.node_type == NodeType.AGENT:
@@ -277,7 +526,8 @@ class WorkflowOrchestrator:
                 output = await self._execute_agent_node(
                     node=node,
                     context=context,
-                    delegation_ctx=delegation_ctx
+                    delegation_ctx=delegation_ctx,
+                    db_bind=db_bind
                 )
 
             elif node.node_type == NodeType.CONDITION:
@@ -289,117 +539,206 @@ class WorkflowOrchestrator:
                 raise ValueError(f"Unknown node type: {node.node_type}")
 
             # Log successful execution
-            log_entry.output_data = output
-            self.db.add(log_entry)
-            await self.db.commit()
+            log_entry["output_data"] = output
+            pending_logs.append(log_entry)
 
             return output
 
         except Exception as e:
             # Log failure
-            log_entry.error_message = str(e)
-            self.db.add(log_entry)
-            await self.db.commit()
+            log_entry["error_message"] = str(e)
+            pending_logs.append(log_entry)
             raise
 
     async def _execute_agent_node(
         self,
         node: WorkflowNode,
         context: dict[str, Any],
-        delegation_ctx: DelegationContext
+        delegation_ctx: DelegationContext,
+        db_bind: Any = None
     ) -> dict[str, Any]:
         """
         Execute an agent node with delegation support.
 
+        Nodes with config {"cacheable": true} reuse a stored output when
+        the agent, prompt and message are unchanged and the output is
+        younger than NODE_CACHE_TTL.
+
         Args:
-            node: Agent node to execute
+            node: Agent node to execute (with its agent relationship loaded)
             context: Shared context
             delegation_ctx: Delegation context
+            db_bind: Engine/connection for the node output cache
 
         Returns:
             Agent response as dict
         """
-        # Load agent blueprint
-        result = await self.db.execute(
-            select(AgentBlueprint).where(AgentBlueprint.id == node.agent_id)
-        )
-        agent_blueprint = result.scalar_one_or_none()
+        # Blueprint is preloaded by _load_workflow (selectinload of WorkflowNode.agent)
+        agent_blueprint = node.agent
 
         if not agent_blueprint:
             raise ValueError(f"Agent {node.agent_id} not found")
 
+        message = self._node_message(context)
+
+        cache_key = None
+        if db_bind is not None and (node.config or {}).get("cacheable"):
+            cache_key = self._node_cache_key(agent_blueprint, message)
+            query = select(NodeExecutionCache.output_data).where(
+                NodeExecutionCache.cache_key == cache_key,
+                NodeExecutionCache.created_at >= datetime.now(timezone.utc) - NODE_CACHE_TTL
+            )
+            async with AsyncSession(db_bind) as cache_db:
+                cached = await cache_db.scalar(query)
+            if cached is not None:
+                logger.info(f"Node {node.id} served from execution cache")
+                return {**cached, "cached": True}
+
         # Create agent with delegation capabilities
         agent = create_agent_with_delegation(
             blueprint=agent_blueprint,
             delegation_ctx=delegation_ctx
         )
 
-        # Prepare message from context
-        # Use last_output or initial_input as the message
-        message = context.get("last_output", {})
-        if isinstance(message, dict):
-            message = message.get("response", str(message))
-        elif not isinstance(message, str):
-            message = str(message)
-
-        # If this is the first node after START, use initial_input
-        if not message or message == "{}":
-            initial = context.get("initial_input", {})
-            message = initial.get("message", str(initial))
-
         # Create dependencies with shared context
-        deps = AgentDependencies()
-        deps.model_extra = {"shared_context": context}
+        deps = AgentDependencies(shared_context=context)
 
         # Execute agent
         logger.info(f"Running agent {agent_blueprint.name}: {message[:100]}...")
 
         try:
             result_data = await agent.run(message, deps=deps)
-            agent_output = result_data.data
+            agent_output = result_data.output
 
-            return {
+            output = {
                 "agent_id": agent_blueprint.id,
                 "agent_name": agent_blueprint.name,
                 "response": agent_output.response,
                 "reasoning": agent_output.reasoning,
                 "tool_calls": agent_output.tool_calls,
-                "delegation_history": delegation_ctx.delegation_history.copy()
+                # Full history is written once, with the final output
+                "delegation_history_len": len(delegation_ctx.delegation_history)
             }
 
         except Exception as e:
             logger.error(f"Agent {agent_blueprint.name} execution failed: {str(e)}")
             raise
 
+        if cache_key is not None:
+            await self._store_node_output(db_bind, cache_key, agent_blueprint.id, output)
+
+        return output
+
+    @staticmethod
+    def _node_message(context: dict[str, Any]) -> str:
+        """Derive a node's input message from last_output or initial_input."""
+        message = context.get("last_output", {})
+        if isinstance(message, dict):
+            message = message.get("response", str(message))
+        elif not isinstance(message, str):
+            message = str(message)
+
+        # If this is the first node after START, use initial_input
+        if not message or message == "{}":
+            initial = context.get("initial_input", {})
+            message = initial.get("message", str(initial))
+
+        return message
+
+    @staticmethod
+    def _node_cache_key(blueprint: AgentBlueprint, message: str) -> str:
+        """Hash everything that determines an agent node's output."""
+        digest = hashlib.blake2b(digest_size=32)
+        for part in (
+            str(blueprint.id),
+            blueprint.model_id,
+            repr(blueprint.temperature),
+            str(blueprint.has_trading_tools),
+            blueprint.system_prompt,
+            message
+        ):
+            digest.update(part.encode())
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    @staticmethod
+    async def _store_node_output(
+        db_bind: Any,
+        cache_key: str,
+        agent_id: int,
+        output: dict[str, Any]
+    ) -> None:
+        """
+        Persist a node output; a concurrent writer of the same key wins.
+
+        Expired rows (including a stale row for this key) are pruned in
+        the same transaction, so the table stays bounded by NODE_CACHE_TTL.
+        """
+        prune = delete(NodeExecutionCache).where(
+            NodeExecutionCache.created_at < datetime.now(timezone.utc) - NODE_CACHE_TTL
+        )
+        stmt = insert(NodeExecutionCache).values(
+            cache_key=cache_key,
+            agent_id=agent_id,
+            output_data=output
+        )
+        async with AsyncSession(db_bind) as cache_db:
+            try:
+                await cache_db.execute(prune)
+                await cache_db.execute(stmt)
+                await cache_db.commit()
+            except IntegrityError:
+                await cache_db.rollback()
+
     async def _update_execution_status(
         self,
+        db: AsyncSession,
         execution_id: int,
         status: WorkflowStatus,
         final_output: Optional[dict[str, Any]] = None,
-        error_message: Optional[str] = None
+        error_message: Optional[str] = None,
+        logs: Sequence[dict[str, Any]] = ()
     ) -> None:
-        """Update execution status in database."""
-        result = await self.db.execute(
-            select(WorkflowExecution).where(WorkflowExecution.id == execution_id)
-        )
-        execution = result.scalar_one()
+        """
+        Update execution status, writing any buffered logs in the same commit.
 
-        execution.status = status
+        Issues a single UPDATE ... RETURNING rather than loading the row first.
+        Log rows go in as one Core executemany INSERT, bypassing the ORM
+        unit of work; they are never read back or mutated here.
+        """
+        values: dict[str, Any] = {"status": status}
         if status in (WorkflowStatus.COMPLETED, WorkflowStatus.FAILED):
-            execution.completed_at = datetime.utcnow()
+            values["completed_at"] = datetime.utcnow()
         if final_output:
-            execution.final_output = final_output
+            values["final_output"] = final_output
         if error_message:
-            execution.error_message = error_message
+            values["error_message"] = error_message
+
+        stmt = (
+            update(WorkflowExecution)
+            .where(WorkflowExecution.id == execution_id)
+            .values(**values)
+            .returning(WorkflowExecution.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        result.scalar_one()
+        if logs:
+            await db.execute(insert(WorkflowExecutionLog.__table__), logs)
 
-        await self.db.commit()
+        await db.commit()
         logger.info(f"Execution {execution_id} status updated to {status}")
 
-    async def get_execution_status(self, execution_id: int) -> WorkflowExecution:
+    async def get_execution_status(
+        self,
+        db: AsyncSession,
+        execution_id: int
+    ) -> WorkflowExecution:
         """Get current execution status."""
-        result = await self.db.execute(
-            select(WorkflowExecution).where(WorkflowExecution.id == execution_id)
+        query = lambda_stmt(
+            lambda: select(WorkflowExecution).where(WorkflowExecution.id == execution_id)
         )
+        result = await db.execute(query)
         execution = result.scalar_one_or_none()
 
         if not execution:
@@ -407,11 +746,54 @@ class WorkflowOrchestrator:
 
         return execution
 
-    async def get_execution_logs(self, execution_id: int) -> list[WorkflowExecutionLog]:
-        """Get detailed execution logs for debugging."""
-        result = await self.db.execute(
-            select(WorkflowExecutionLog)
-            .where(WorkflowExecutionLog.execution_id == execution_id)
-            .order_by(WorkflowExecutionLog.timestamp)
-        )
-        return list(result.scalars().all())
+    async def get_execution_logs(
+        self,
+        db: AsyncSession,
+        execution_id: int,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> list[Any]:
+        """
+        Get a page of execution logs for debugging, oldest first.
+
+        Args:
+            db: Database session
+            execution_id: Execution whose logs to read
+            after_id: Keyset cursor; return logs with a higher ID than this
+            limit: Maximum number of logs (None for all)
+
+        Returns:
+            Log rows ordered by ID
+        """
+        return [log async for log in self.stream_execution_logs(db, execution_id, after_id, limit)]
+
+    async def stream_execution_logs(
+        self,
+        db: AsyncSession,
+        execution_id: int,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[Any]:
+        """
+        Yield execution logs in ID order from a server-side cursor.
+
+        Core rows (attribute access like the ORM entity) are fetched in
+        batches of LOG_STREAM_BATCH_SIZE and never enter the session
+        identity map, so memory stays flat however many logs there are.
+        """
+        logs = WorkflowExecutionLog.__table__
+        query = select(logs).where(logs.c.execution_id == execution_id).order_by(logs.c.id)
+        if after_id is not None:
+            query = query.where(logs.c.id > after_id)
+        if limit is not None:
+            query = query.limit(limit)
+
+        result = await db.stream(query.execution_options(yield_per=LOG_STREAM_BATCH_SIZE))
+        async for row in result:
+            yield row
+
+
+@lru_cache(maxsize=1)
+def get_orchestrator() -> WorkflowOrchestrator:
+    """Return the process-wide workflow orchestrator."""
+    return WorkflowOrchestrator()
@@ -5,7 +5,19 @@ Defines models for academic papers, citations, and search queries.
 from typing import Optional, List
 from datetime import date, datetime
 from enum import Enum
-from pydantic import BaseModel, HttpUrl, Field
+import re
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+
+# Cheap shape check for URL fields; full URL parsing is left to the HTTP client
+_URL_RE = re.compile(r"^https?://[^\s<>]+$")
+
+
+def _check_url(value: Optional[str]) -> Optional[str]:
+    """Validate that a non-empty URL field looks like an http(s) URL."""
+    # Empty strings are allowed: PubMed records without a PMID have no URL
+    if value and not _URL_RE.match(value):
+        raise ValueError(f"Invalid URL: {value!r}")
+    return value
 
 
 class PaperSource(str, Enum):
@@ -27,10 +39,11 @@ class PaperResult(BaseModel):
     """
     Structured representation of an academic paper.
 
-    Compatible with ArXiv, PubMed, and scraped papers.
+    Compatible with ArXiv, PubMed, and scraped papers. Frozen: results are
+    value objects and are never mutated after construction.
     """
     title: str = Field(..., description="Paper title")
-    authors: List[str] = Field(default_factory=list, description="List of author names")
+    authors: tuple[str, ...] = Field((), description="List of author names")
     abstract: Optional[str] = Field(None, description="Paper abstract/summary")
     url: str = Field(..., description="Direct link to paper")
     doi: Optional[str] = Field(None, description="Digital Object Identifier")
@@ -39,8 +52,14 @@ class PaperResult(BaseModel):
     source: PaperSource = Field(..., description="Source of the paper (arxiv, pubmed, web)")
     pdf_url: Optional[str] = Field(None, description="Direct PDF link if available")
 
-    class Config:
-        json_schema_extra = {
+    @field_validator("url", "pdf_url")
+    @classmethod
+    def validate_url(cls, value: Optional[str]) -> Optional[str]:
+        return _check_url(value)
+
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "title": "Attention Is All You Need",
                 "authors": ["Ashish Vaswani", "Noam Shazeer"],
@@ -53,6 +72,7 @@ class PaperResult(BaseModel):
                 "pdf_url": "https://arxiv.org/pdf/1706.03762.pdf"
             }
         }
+    )
 
 
 class SearchQuery(BaseModel):
@@ -61,30 +81,37 @@ class SearchQuery(BaseModel):
     max_results: int = Field(10, ge=1, le=100, description="Maximum number of results to return")
     source: Optional[PaperSource] = Field(None, description="Specific source to search (optional)")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "query": "machine learning transformers",
                 "max_results": 20,
                 "source": "arxiv"
             }
         }
+    )
 
 
 class ScrapeRequest(BaseModel):
     """Request to scrape a webpage."""
     url: str = Field(..., description="URL to scrape")
     selector: Optional[str] = Field(None, description="Optional CSS selector to extract specific content")
-    extract_links: bool = Field(False, description="Whether to extract all links from the page")
+    extract_links: bool = Field(False, description="Whether to extract links (from the selected elements if a selector is given)")
+
+    @field_validator("url")
+    @classmethod
+    def validate_url(cls, value: str) -> str:
+        return _check_url(value)
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "url": "https://arxiv.org/abs/1706.03762",
                 "selector": "div.abstract",
                 "extract_links": False
             }
         }
+    )
 
 
 class ScrapeResult(BaseModel):
@@ -95,8 +122,8 @@ class ScrapeResult(BaseModel):
     links: List[dict] = Field(default_factory=list, description="Extracted links if requested")
     metadata: dict = Field(default_factory=dict, description="Additional metadata (meta tags, etc.)")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "url": "https://example.com/paper",
                 "title": "Research Paper Title",
@@ -105,6 +132,7 @@ class ScrapeResult(BaseModel):
                 "metadata": {"description": "Paper description from meta tag"}
             }
         }
+    )
 
 
 class CitationRequest(BaseModel):
@@ -112,8 +140,8 @@ class CitationRequest(BaseModel):
     paper: PaperResult = Field(..., description="Paper to cite")
     format: CitationFormat = Field(CitationFormat.BIBTEX, description="Desired citation format")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "paper": {
                     "title": "Attention Is All You Need",
@@ -125,6 +153,7 @@ class CitationRequest(BaseModel):
                 "format": "bibtex"
             }
         }
+    )
 
 
 class CitationResponse(BaseModel):
@@ -132,13 +161,14 @@ class CitationResponse(BaseModel):
     citation: str = Field(..., description="Formatted citation string")
     format: CitationFormat = Field(..., description="Format used")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "citation": "@article{vaswani2017attention,\\n  title={Attention Is All You Need},\\n  author={Vaswani, Ashish and others},\\n  year={2017}\\n}",
                 "format": "bibtex"
             }
         }
+    )
 
 
 # Database models for saved citations
@@ -154,5 +184,4 @@ class SavedCitationRead(SavedCitationCreate):
     id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -2,11 +2,15 @@
 Research assistant tools for academic search and web scraping.
 Implements ArXiv search, PubMed search, web scraping, and citation formatting.
 """
+import asyncio
+import sys
 import httpx
-from typing import List, Optional, Dict, Any
-from bs4 import BeautifulSoup
-import xml.etree.ElementTree as ET
-from datetime import datetime
+from typing import List, Optional, Dict, Any, AsyncIterator, Awaitable, Callable
+from selectolax.lexbor import LexborHTMLParser
+from lxml import etree as ET
+from cachetools import TTLCache
+import orjson
+from http_client import get_openrouter_client
 from research_schemas import (
     PaperResult,
     PaperSource,
@@ -20,6 +24,59 @@ ARXIV_API_URL = "http://export.arxiv.org/api/query"
 PUBMED_SEARCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
 PUBMED_FETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
 
+# In-flight searches per batch call; NCBI allows ~3 requests/s without an API key
+ARXIV_BATCH_CONCURRENCY = 4
+PUBMED_BATCH_CONCURRENCY = 3
+
+# (source, query, max_results) -> tuple of results; papers change slowly
+_SEARCH_CACHE_TTL_SECONDS = 3600
+_search_cache: TTLCache = TTLCache(maxsize=512, ttl=_SEARCH_CACHE_TTL_SECONDS)
+
+# Bytes of a scraped page read before the rest of the body is dropped
+SCRAPE_MAX_BYTES = 5 * 1024 * 1024
+
+# Elements dropped before extracting a page's text
+_SCRAPE_STRIP_TAGS = frozenset({"script", "style", "nav", "header", "footer"})
+_SCRAPE_SCAN_SELECTOR = ", ".join(["title", "meta", *sorted(_SCRAPE_STRIP_TAGS)])
+
+# Atom tags in Clark notation, matched directly against element.tag
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ARXIV_ENTRY_TAG = _ATOM + "entry"
+_ATOM_AUTHOR = _ATOM + "author"
+_ATOM_NAME = _ATOM + "name"
+_ATOM_LINK = _ATOM + "link"
+# Tag -> field name for single-valued entry children
+_ATOM_FIELDS = {_ATOM + name: name for name in ("id", "title", "summary", "published")}
+
+# Compiled once; lxml XPath objects skip re-parsing the path on every call
+_PUBMED_AUTHOR_XPATH = ET.XPath(".//Author")
+_PUBMED_DOI_XPATH = ET.XPath(".//ArticleId[@IdType='doi']/text()")
+
+# PubMed <Month> abbreviations; a dict lookup instead of strptime("%b") per article
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12
+}
+
+
+async def _stream_elements(response: httpx.Response, tag: str) -> AsyncIterator[Any]:
+    """
+    Incrementally parse a streamed XML response, yielding each <tag> element.
+
+    Each element is cleared, along with the siblings processed before it,
+    once the caller moves on, so memory stays bounded by one element.
+    """
+    parser = ET.XMLPullParser(events=("end",), tag=tag)
+    async for chunk in response.aiter_bytes():
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            yield element
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+    # Raises on a truncated or malformed document
+    parser.close()
+
 
 async def search_arxiv(
     query: str,
@@ -29,10 +86,12 @@ async def search_arxiv(
     """
     Search ArXiv for academic papers.
 
+    Results are cached in-process for an hour per (query, max_results).
+
     Args:
         query: Search query string (supports ArXiv query syntax)
         max_results: Maximum number of results to return (1-100)
-        http_client: Optional async HTTP client
+        http_client: Optional async HTTP client (defaults to the shared client)
 
     Returns:
         List of PaperResult objects
@@ -43,74 +102,84 @@ async def search_arxiv(
     Example:
         results = await search_arxiv("quantum computing", max_results=5)
     """
-    close_client = False
-    if http_client is None:
-        http_client = httpx.AsyncClient(timeout=30.0)
-        close_client = True
-
-    try:
-        # Build ArXiv API query
-        params = {
-            "search_query": f"all:{query}",
-            "start": 0,
-            "max_results": min(max_results, 100),
-            "sortBy": "relevance",
-            "sortOrder": "descending"
-        }
-
-        response = await http_client.get(ARXIV_API_URL, params=params)
+    cache_key = (PaperSource.ARXIV, query, max_results)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        return list(cached)
+
+    # Reuse the process-wide pooled client instead of a handshake per call
+    http_client = http_client or get_openrouter_client()
+
+    # Build ArXiv API query
+    params = {
+        "search_query": f"all:{query}",
+        "start": 0,
+        "max_results": min(max_results, 100),
+        "sortBy": "relevance",
+        "sortOrder": "descending"
+    }
+
+    # Parse entries as they arrive instead of buffering the whole feed
+    papers = []
+    async with http_client.stream("GET", ARXIV_API_URL, params=params) as response:
         response.raise_for_status()
-
-        # Parse XML response
-        root = ET.fromstring(response.text)
-        ns = {"atom": "http://www.w3.org/2005/Atom",
-              "arxiv": "http://arxiv.org/schemas/atom"}
-
-        papers = []
-        for entry in root.findall("atom:entry", ns):
-            # Extract authors
-            authors = []
-            for author in entry.findall("atom:author/atom:name", ns):
-                if author.text:
-                    authors.append(author.text)
-
-            # Extract published date
-            published = entry.find("atom:published", ns)
-            pub_date = published.text[:10] if published is not None and published.text else None
-
-            # Extract DOI from links
-            doi = None
-            doi_link = entry.find("atom:link[@title='doi']", ns)
-            if doi_link is not None and "href" in doi_link.attrib:
-                doi = doi_link.attrib["href"].replace("http://dx.doi.org/", "")
-
-            # Extract main URL and PDF URL
-            main_url = entry.find("atom:id", ns)
-            pdf_link = entry.find("atom:link[@title='pdf']", ns)
-
-            # Extract title and abstract
-            title_elem = entry.find("atom:title", ns)
-            abstract_elem = entry.find("atom:summary", ns)
-
-            if main_url is not None and main_url.text and title_elem is not None:
-                paper = PaperResult(
-                    title=title_elem.text.strip() if title_elem.text else "",
-                    authors=authors,
-                    abstract=abstract_elem.text.strip() if abstract_elem is not None and abstract_elem.text else None,
-                    url=main_url.text.strip(),
-                    doi=doi,
-                    published_date=pub_date,
-                    journal="arXiv",
-                    source=PaperSource.ARXIV,
-                    pdf_url=pdf_link.attrib.get("href") if pdf_link is not None else None
-                )
+        async for entry in _stream_elements(response, _ARXIV_ENTRY_TAG):
+            paper = _parse_arxiv_entry(entry)
+            if paper is not None:
                 papers.append(paper)
 
-        return papers
-
-    finally:
-        if close_client:
-            await http_client.aclose()
+    _search_cache[cache_key] = tuple(papers)
+    return papers
+
+
+def _parse_arxiv_entry(entry: Any) -> Optional[PaperResult]:
+    """Build a PaperResult from an Atom <entry>, or None if it has no ID or title."""
+    # One pass over the entry's children instead of a path lookup per field;
+    # the first occurrence of each element wins, as with find()
+    authors = []
+    fields: dict[str, Any] = {}
+    links: dict[str, str] = {}
+    for child in entry:
+        tag = child.tag
+        if tag == _ATOM_AUTHOR:
+            for name in child.iterchildren(_ATOM_NAME):
+                if name.text:
+                    authors.append(name.text)
+        elif tag == _ATOM_LINK:
+            link_title = child.get("title")
+            if link_title in ("doi", "pdf") and link_title not in links:
+                links[link_title] = child.get("href")
+        elif tag in _ATOM_FIELDS:
+            fields.setdefault(_ATOM_FIELDS[tag], child)
+
+    # Extract published date
+    published = fields.get("published")
+    pub_date = published.text[:10] if published is not None and published.text else None
+
+    # Extract DOI from links
+    doi_href = links.get("doi")
+    doi = doi_href.replace("http://dx.doi.org/", "") if doi_href is not None else None
+
+    # Extract main URL, title and abstract
+    main_url = fields.get("id")
+    title_elem = fields.get("title")
+    abstract_elem = fields.get("summary")
+
+    if main_url is None or not main_url.text or title_elem is None:
+        return None
+
+    # Fields are already in their final types; skip re-validating parser output
+    return PaperResult.model_construct(
+        title=title_elem.text.strip() if title_elem.text else "",
+        authors=tuple(authors),
+        abstract=abstract_elem.text.strip() if abstract_elem is not None and abstract_elem.text else None,
+        url=main_url.text.strip(),
+        doi=doi,
+        published_date=pub_date,
+        journal="arXiv",
+        source=PaperSource.ARXIV,
+        pdf_url=links.get("pdf")
+    )
 
 
 async def search_pubmed(
@@ -121,10 +190,12 @@ async def search_pubmed(
     """
     Search PubMed for biomedical papers using NCBI E-utilities API.
 
+    Results are cached in-process for an hour per (query, max_results).
+
     Args:
         query: Search query string
         max_results: Maximum number of results to return (1-100)
-        http_client: Optional async HTTP client
+        http_client: Optional async HTTP client (defaults to the shared client)
 
     Returns:
         List of PaperResult objects
@@ -135,132 +206,203 @@ async def search_pubmed(
     Example:
         results = await search_pubmed("CRISPR gene editing", max_results=5)
     """
-    close_client = False
-    if http_client is None:
-        http_client = httpx.AsyncClient(timeout=30.0)
-        close_client = True
-
-    try:
-        # Step 1: Search for PMIDs
-        search_params = {
-            "db": "pubmed",
-            "term": query,
-            "retmax": min(max_results, 100),
-            "retmode": "json"
-        }
-
-        search_response = await http_client.get(PUBMED_SEARCH_URL, params=search_params)
-        search_response.raise_for_status()
-        search_data = search_response.json()
-
-        pmids = search_data.get("esearchresult", {}).get("idlist", [])
-        if not pmids:
-            return []
-
-        # Step 2: Fetch details for PMIDs
-        fetch_params = {
-            "db": "pubmed",
-            "id": ",".join(pmids),
-            "retmode": "xml"
-        }
-
-        fetch_response = await http_client.get(PUBMED_FETCH_URL, params=fetch_params)
+    cache_key = (PaperSource.PUBMED, query, max_results)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        return list(cached)
+
+    # Reuse the process-wide pooled client instead of a handshake per call
+    http_client = http_client or get_openrouter_client()
+
+    # Step 1: Search for PMIDs
+    search_params = {
+        "db": "pubmed",
+        "term": query,
+        "retmax": min(max_results, 100),
+        "retmode": "json"
+    }
+
+    search_response = await http_client.get(PUBMED_SEARCH_URL, params=search_params)
+    search_response.raise_for_status()
+    search_data = orjson.loads(search_response.content)
+
+    pmids = search_data.get("esearchresult", {}).get("idlist", [])
+    if not pmids:
+        _search_cache[cache_key] = ()
+        return []
+
+    # Step 2: Fetch details for PMIDs
+    fetch_params = {
+        "db": "pubmed",
+        "id": ",".join(pmids),
+        "retmode": "xml"
+    }
+
+    # Parse articles as they arrive instead of buffering the whole response
+    papers = []
+    async with http_client.stream("GET", PUBMED_FETCH_URL, params=fetch_params) as fetch_response:
         fetch_response.raise_for_status()
+        async for article in _stream_elements(fetch_response, "PubmedArticle"):
+            paper = _parse_pubmed_article(article)
+            if paper is not None:
+                papers.append(paper)
+
+    _search_cache[cache_key] = tuple(papers)
+    return papers
+
+
+def _parse_pubmed_article(article: Any) -> Optional[PaperResult]:
+    """Build a PaperResult from a <PubmedArticle>, or None if it has no title."""
+    # Extract title
+    title_elem = article.find(".//ArticleTitle")
+    if title_elem is None or not title_elem.text:
+        return None
+
+    # Extract authors
+    authors = []
+    for author in _PUBMED_AUTHOR_XPATH(article):
+        lastname = author.find("LastName")
+        forename = author.find("ForeName")
+        if lastname is not None and lastname.text:
+            name = lastname.text
+            if forename is not None and forename.text:
+                name = f"{forename.text} {name}"
+            authors.append(name)
+
+    # Extract abstract
+    abstract_elem = article.find(".//Abstract/AbstractText")
+    abstract = abstract_elem.text if abstract_elem is not None and abstract_elem.text else None
+
+    # Extract publication date
+    pub_date = None
+    pub_date_elem = article.find(".//PubDate")
+    if pub_date_elem is not None:
+        year = pub_date_elem.find("Year")
+        month = pub_date_elem.find("Month")
+        day = pub_date_elem.find("Day")
+        if year is not None and year.text:
+            pub_date = year.text
+            if month is not None and month.text:
+                month_num = _MONTHS.get(month.text[:3].title())
+                if month_num is not None:
+                    pub_date = f"{year.text}-{month_num:02d}"
+                    if day is not None and day.text:
+                        pub_date = f"{pub_date}-{day.text.zfill(2)}"
+
+    # Extract PMID and DOI
+    pmid_elem = article.find(".//PMID")
+    pmid = pmid_elem.text if pmid_elem is not None else None
+
+    doi_ids = _PUBMED_DOI_XPATH(article)
+    doi = str(doi_ids[0]) if doi_ids else None
+
+    # Extract journal
+    journal_elem = article.find(".//Journal/Title")
+    # Journal names repeat across results; share one string object per name
+    journal = sys.intern(journal_elem.text.strip()) if journal_elem is not None and journal_elem.text else "PubMed"
+
+    # Build PubMed URL
+    url = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/" if pmid else ""
+
+    # Fields are already in their final types; skip re-validating parser output
+    return PaperResult.model_construct(
+        title=title_elem.text.strip(),
+        authors=tuple(authors),
+        abstract=abstract,
+        url=url,
+        doi=doi,
+        published_date=pub_date,
+        journal=journal,
+        source=PaperSource.PUBMED,
+        pdf_url=None  # PubMed doesn't provide direct PDF links
+    )
+
+
+def clear_search_cache() -> None:
+    """Drop all cached ArXiv/PubMed search results."""
+    _search_cache.clear()
+
+
+async def _search_batch(
+    search: Callable[..., Awaitable[List[PaperResult]]],
+    queries: List[str],
+    max_results: int,
+    concurrency: int,
+    http_client: Optional[httpx.AsyncClient]
+) -> List[List[PaperResult]]:
+    """Run one search per query concurrently, at most `concurrency` at a time."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(query: str) -> List[PaperResult]:
+        async with semaphore:
+            return await search(query, max_results, http_client)
+
+    return await asyncio.gather(*(run_one(query) for query in queries))
+
+
+async def search_arxiv_batch(
+    queries: List[str],
+    max_results: int = 10,
+    concurrency: int = ARXIV_BATCH_CONCURRENCY,
+    http_client: Optional[httpx.AsyncClient] = None
+) -> List[List[PaperResult]]:
+    """
+    Run several ArXiv searches concurrently.
+
+    Args:
+        queries: Search query strings
+        max_results: Maximum number of results per query (1-100)
+        concurrency: Maximum searches in flight at once
+        http_client: Optional async HTTP client (defaults to the shared client)
+
+    Returns:
+        One list of PaperResult objects per query, in query order
+    """
+    return await _search_batch(search_arxiv, queries, max_results, concurrency, http_client)
+
+
+async def search_pubmed_batch(
+    queries: List[str],
+    max_results: int = 10,
+    concurrency: int = PUBMED_BATCH_CONCURRENCY,
+    http_client: Optional[httpx.AsyncClient] = None
+) -> List[List[PaperResult]]:
+    """
+    Run several PubMed searches concurrently.
 
-        # Parse XML response
-        root = ET.fromstring(fetch_response.text)
-        papers = []
-
-        for article in root.findall(".//PubmedArticle"):
-            # Extract title
-            title_elem = article.find(".//ArticleTitle")
-            if title_elem is None or not title_elem.text:
-                continue
-
-            # Extract authors
-            authors = []
-            for author in article.findall(".//Author"):
-                lastname = author.find("LastName")
-                forename = author.find("ForeName")
-                if lastname is not None and lastname.text:
-                    name = lastname.text
-                    if forename is not None and forename.text:
-                        name = f"{forename.text} {name}"
-                    authors.append(name)
-
-            # Extract abstract
-            abstract_elem = article.find(".//Abstract/AbstractText")
-            abstract = abstract_elem.text if abstract_elem is not None and abstract_elem.text else None
-
-            # Extract publication date
-            pub_date = None
-            pub_date_elem = article.find(".//PubDate")
-            if pub_date_elem is not None:
-                year = pub_date_elem.find("Year")
-                month = pub_date_elem.find("Month")
-                day = pub_date_elem.find("Day")
-                if year is not None and year.text:
-                    pub_date = year.text
-                    if month is not None and month.text:
-                        try:
-                            month_num = datetime.strptime(month.text[:3], "%b").month
-                            pub_date = f"{year.text}-{month_num:02d}"
-                            if day is not None and day.text:
-                                pub_date = f"{pub_date}-{day.text.zfill(2)}"
-                        except ValueError:
-                            pass
-
-            # Extract PMID and DOI
-            pmid_elem = article.find(".//PMID")
-            pmid = pmid_elem.text if pmid_elem is not None else None
-
-            doi = None
-            for article_id in article.findall(".//ArticleId"):
-                if article_id.get("IdType") == "doi" and article_id.text:
-                    doi = article_id.text
-                    break
-
-            # Extract journal
-            journal_elem = article.find(".//Journal/Title")
-            journal = journal_elem.text if journal_elem is not None and journal_elem.text else "PubMed"
-
-            # Build PubMed URL
-            url = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/" if pmid else ""
-
-            paper = PaperResult(
-                title=title_elem.text.strip(),
-                authors=authors,
-                abstract=abstract,
-                url=url,
-                doi=doi,
-                published_date=pub_date,
-                journal=journal,
-                source=PaperSource.PUBMED,
-                pdf_url=None  # PubMed doesn't provide direct PDF links
-            )
-            papers.append(paper)
-
-        return papers
-
-    finally:
-        if close_client:
-            await http_client.aclose()
+    Each search is an esearch followed by an efetch, so the two requests of
+    one query stay serial while different queries overlap.
+
+    Args:
+        queries: Search query strings
+        max_results: Maximum number of results per query (1-100)
+        concurrency: Maximum searches in flight at once
+        http_client: Optional async HTTP client (defaults to the shared client)
+
+    Returns:
+        One list of PaperResult objects per query, in query order
+    """
+    return await _search_batch(search_pubmed, queries, max_results, concurrency, http_client)
 
 
 async def scrape_webpage(
     url: str,
     selector: Optional[str] = None,
     extract_links: bool = False,
-    http_client: Optional[httpx.AsyncClient] = None
+    http_client: Optional[httpx.AsyncClient] = None,
+    max_bytes: Optional[int] = SCRAPE_MAX_BYTES
 ) -> ScrapeResult:
     """
-    Scrape content from a webpage using BeautifulSoup.
+    Scrape content from a webpage using selectolax (Lexbor HTML parser).
 
     Args:
         url: URL to scrape
         selector: Optional CSS selector to extract specific content
-        extract_links: Whether to extract all links from the page
-        http_client: Optional async HTTP client
+        extract_links: Whether to extract links; limited to the selected
+            elements when a selector is given
+        http_client: Optional async HTTP client (defaults to the shared client)
+        max_bytes: Stop reading the body after this many bytes (None for no cap);
+            a small cap is enough when only the <head> metadata is needed
 
     Returns:
         ScrapeResult with extracted content
@@ -271,59 +413,77 @@ async def scrape_webpage(
     Example:
         result = await scrape_webpage("https://example.com", selector="div.content")
     """
-    close_client = False
-    if http_client is None:
-        http_client = httpx.AsyncClient(timeout=30.0, follow_redirects=True)
-        close_client = True
+    # Reuse the process-wide pooled client instead of a handshake per call
+    http_client = http_client or get_openrouter_client()
 
-    try:
-        response = await http_client.get(url)
+    # Stream the body so oversized pages are cut off instead of fully buffered
+    body = bytearray()
+    async with http_client.stream("GET", url, follow_redirects=True) as response:
         response.raise_for_status()
+        async for chunk in response.aiter_bytes(65536):
+            body += chunk
+            if max_bytes is not None and len(body) >= max_bytes:
+                del body[max_bytes:]
+                break
+        encoding = response.encoding or "utf-8"
+
+    # A cut may split a multi-byte character; replace it rather than fail
+    tree = LexborHTMLParser(body.decode(encoding, errors="replace"))
+
+    # One traversal finds the title, metadata and the boilerplate to strip
+    nodes = tree.css(_SCRAPE_SCAN_SELECTOR)
+
+    # Extract title and metadata
+    title = None
+    metadata = {}
+    for node in nodes:
+        if node.tag == "title":
+            if title is None:
+                title = node.text(strip=True)
+        elif node.tag == "meta":
+            attrs = node.attributes
+            name = attrs.get("name") or attrs.get("property")
+            content_val = attrs.get("content")
+            if name and content_val:
+                metadata[name] = content_val
 
-        soup = BeautifulSoup(response.text, "lxml")
-
-        # Extract title
-        title_tag = soup.find("title")
-        title = title_tag.get_text(strip=True) if title_tag else None
-
-        # Extract content
-        if selector:
-            selected = soup.select(selector)
-            content = "\n".join([elem.get_text(strip=True) for elem in selected])
-        else:
-            # Remove script and style elements
-            for script in soup(["script", "style", "nav", "header", "footer"]):
-                script.decompose()
-            content = soup.get_text(separator="\n", strip=True)
+    # Extract content (and, with a selector, links from the same elements)
+    links = []
+    if selector:
+        texts = []
+        for elem in tree.css(selector):
+            texts.append(elem.text(strip=True))
+            if extract_links:
+                _collect_links(elem, links)
+        content = "\n".join(texts)
+    else:
+        # Remove script and style elements; reverse document order destroys
+        # nested matches before their ancestors
+        for node in reversed(nodes):
+            if node.tag in _SCRAPE_STRIP_TAGS:
+                node.decompose()
+        root = tree.body or tree.root
+        content = root.text(separator="\n", strip=True) if root else ""
 
         # Extract links if requested
-        links = []
         if extract_links:
-            for link in soup.find_all("a", href=True):
-                link_text = link.get_text(strip=True)
-                link_href = link["href"]
-                if link_href:
-                    links.append({"text": link_text, "href": link_href})
-
-        # Extract metadata
-        metadata = {}
-        for meta in soup.find_all("meta"):
-            name = meta.get("name") or meta.get("property")
-            content_val = meta.get("content")
-            if name and content_val:
-                metadata[name] = content_val
+            _collect_links(tree, links)
+
+    return ScrapeResult(
+        url=url,
+        title=title,
+        content=content,
+        links=links,
+        metadata=metadata
+    )
 
-        return ScrapeResult(
-            url=url,
-            title=title,
-            content=content,
-            links=links,
-            metadata=metadata
-        )
 
-    finally:
-        if close_client:
-            await http_client.aclose()
+def _collect_links(node: Any, links: List[dict]) -> None:
+    """Append {"text", "href"} for every <a href> under a node (or tree)."""
+    for link in node.css("a[href]"):
+        link_href = link.attributes.get("href")
+        if link_href:
+            links.append({"text": link.text(strip=True), "href": link_href})
 
 
 def format_citation(paper: PaperResult, format: CitationFormat) -> str:
@@ -340,16 +500,11 @@ def format_citation(paper: PaperResult, format: CitationFormat) -> str:
     Example:
         citation = format_citation(paper, CitationFormat.BIBTEX)
     """
-    if format == CitationFormat.BIBTEX:
-        return _format_bibtex(paper)
-    elif format == CitationFormat.APA:
-        return _format_apa(paper)
-    elif format == CitationFormat.MLA:
-        return _format_mla(paper)
-    elif format == CitationFormat.CHICAGO:
-        return _format_chicago(paper)
-    else:
+    try:
+        formatter = _FORMATTERS[format]
+    except KeyError:
         raise ValueError(f"Unsupported citation format: {format}")
+    return formatter(paper)
 
 
 def _format_bibtex(paper: PaperResult) -> str:
@@ -363,24 +518,26 @@ def _format_bibtex(paper: PaperResult) -> str:
     authors_str = " and ".join(paper.authors) if paper.authors else "Unknown"
 
     entry_type = "article"
-    bibtex = f"@{entry_type}{{{cite_key},\n"
-    bibtex += f"  title={{{paper.title}}},\n"
-    bibtex += f"  author={{{authors_str}}},\n"
+    lines = [
+        f"@{entry_type}{{{cite_key},",
+        f"  title={{{paper.title}}},",
+        f"  author={{{authors_str}}},"
+    ]
 
     if paper.journal:
-        bibtex += f"  journal={{{paper.journal}}},\n"
+        lines.append(f"  journal={{{paper.journal}}},")
 
     if paper.published_date:
-        bibtex += f"  year={{{year}}},\n"
+        lines.append(f"  year={{{year}}},")
 
     if paper.doi:
-        bibtex += f"  doi={{{paper.doi}}},\n"
+        lines.append(f"  doi={{{paper.doi}}},")
 
     if paper.url:
-        bibtex += f"  url={{{paper.url}}},\n"
+        lines.append(f"  url={{{paper.url}}},")
 
-    bibtex += "}"
-    return bibtex
+    lines.append("}")
+    return "\n".join(lines)
 
 
 def _format_apa(paper: PaperResult) -> str:
@@ -407,75 +564,76 @@ def _format_apa(paper: PaperResult) -> str:
     else:
         authors_str = "Unknown"
 
-    citation = f"{authors_str} ({year}). {paper.title}. "
+    parts = [f"{authors_str} ({year}). {paper.title}. "]
 
     if paper.journal:
-        citation += f"{paper.journal}. "
+        parts.append(f"{paper.journal}. ")
 
     if paper.doi:
-        citation += f"https://doi.org/{paper.doi}"
+        parts.append(f"https://doi.org/{paper.doi}")
     elif paper.url:
-        citation += paper.url
+        parts.append(paper.url)
 
-    return citation
+    return "".join(parts)
 
 
-def _format_mla(paper: PaperResult) -> str:
-    """Format paper in MLA style (9th edition)."""
-    # Format authors (Last, First)
-    if paper.authors:
-        first_author = paper.authors[0]
-        name_parts = first_author.split()
-        if len(name_parts) >= 2:
-            authors_str = f"{name_parts[-1]}, {' '.join(name_parts[:-1])}"
-        else:
-            authors_str = first_author
+def _last_first_authors(paper: PaperResult, et_al: str) -> str:
+    """First author as "Last, First", plus `et_al` when there are co-authors."""
+    if not paper.authors:
+        return "Unknown"
 
-        if len(paper.authors) > 1:
-            authors_str += ", et al."
+    first_author = paper.authors[0]
+    name_parts = first_author.split()
+    if len(name_parts) >= 2:
+        authors_str = f"{name_parts[-1]}, {' '.join(name_parts[:-1])}"
     else:
-        authors_str = "Unknown"
+        authors_str = first_author
 
-    citation = f"{authors_str}. \"{paper.title}.\" "
+    if len(paper.authors) > 1:
+        authors_str += et_al
+    return authors_str
+
+
+def _format_mla(paper: PaperResult) -> str:
+    """Format paper in MLA style (9th edition)."""
+    authors_str = _last_first_authors(paper, ", et al.")
+
+    parts = [f"{authors_str}. \"{paper.title}.\" "]
 
     if paper.journal:
-        citation += f"{paper.journal}, "
+        parts.append(f"{paper.journal}, ")
 
     if paper.published_date:
-        year = paper.published_date[:4]
-        citation += f"{year}, "
+        parts.append(f"{paper.published_date[:4]}, ")
 
-    citation += paper.url + "."
+    parts.append(f"{paper.url}.")
 
-    return citation
+    return "".join(parts)
 
 
 def _format_chicago(paper: PaperResult) -> str:
     """Format paper in Chicago style (author-date)."""
     year = paper.published_date[:4] if paper.published_date else "n.d."
 
-    # Format authors (Last, First)
-    if paper.authors:
-        first_author = paper.authors[0]
-        name_parts = first_author.split()
-        if len(name_parts) >= 2:
-            authors_str = f"{name_parts[-1]}, {' '.join(name_parts[:-1])}"
-        else:
-            authors_str = first_author
-
-        if len(paper.authors) > 1:
-            authors_str += " et al."
-    else:
-        authors_str = "Unknown"
+    authors_str = _last_first_authors(paper, " et al.")
 
-    citation = f"{authors_str}. {year}. \"{paper.title}.\" "
+    parts = [f"{authors_str}. {year}. \"{paper.title}.\" "]
 
     if paper.journal:
-        citation += f"{paper.journal}. "
+        parts.append(f"{paper.journal}. ")
 
     if paper.doi:
-        citation += f"https://doi.org/{paper.doi}."
+        parts.append(f"https://doi.org/{paper.doi}.")
     elif paper.url:
-        citation += paper.url + "."
+        parts.append(f"{paper.url}.")
+
+    return "".join(parts)
+
 
-    return citation
+# Dispatch table for format_citation
+_FORMATTERS: Dict[CitationFormat, Callable[[PaperResult], str]] = {
+    CitationFormat.BIBTEX: _format_bibtex,
+    CitationFormat.APA: _format_apa,
+    CitationFormat.MLA: _format_mla,
+    CitationFormat.CHICAGO: _format_chicago
+}
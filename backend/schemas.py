@@ -3,7 +3,7 @@ Pydantic schemas for request/response validation and serialization.
 Implements type-safe data validation for the API layer.
 """
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -52,11 +52,12 @@ class AgentBlueprintList(BaseModel):
     """Schema for paginated list of agent blueprints."""
     total: int
     agents: list[AgentBlueprintResponse]
+    next_cursor: Optional[int] = Field(None, description="Pass as after_id to fetch the next page")
 
 
 class ChatMessage(BaseModel):
     """Schema for chat messages in the agent sandbox."""
-    role: str = Field(..., pattern="^(user|assistant|system)$")
+    role: Literal["user", "assistant", "system"]
     content: str = Field(..., min_length=1)
 
 
@@ -3,10 +3,24 @@ Agent tools including CCXT trading capabilities.
 Implements proper exchange initialization and precision handling.
 """
 from typing import Optional, Any
-from pydantic import BaseModel
-import ccxt
+from pathlib import Path
+import asyncio
+import hashlib
+import time
+from pydantic import BaseModel, field_validator
+import ccxt.async_support as ccxt
+import orjson
 from database import settings
 
+# Market listings change rarely; reuse a snapshot for up to 6 hours
+MARKETS_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+# Exchanges agents may trade on; also validates TradingContext.exchange_id
+SUPPORTED_EXCHANGES = ("binance", "coinbase", "kraken", "bybit", "okx")
+_EXCHANGE_CLASSES: dict[str, type] = {
+    exchange_id: getattr(ccxt, exchange_id) for exchange_id in SUPPORTED_EXCHANGES
+}
+
 
 class TradingContext(BaseModel):
     """Context for trading operations. Passed via RunContext deps."""
@@ -15,6 +29,13 @@ class TradingContext(BaseModel):
     secret: Optional[str] = None
     testnet: bool = True
 
+    @field_validator("exchange_id")
+    @classmethod
+    def validate_exchange_id(cls, value: str) -> str:
+        if value not in SUPPORTED_EXCHANGES:
+            raise ValueError(f"Unsupported exchange: {value}")
+        return value
+
 
 def get_exchange(ctx: TradingContext) -> ccxt.Exchange:
     """
@@ -28,8 +49,14 @@ def get_exchange(ctx: TradingContext) -> ccxt.Exchange:
 
     Returns:
         Configured exchange instance
+
+    Raises:
+        ValueError: If the exchange is not in SUPPORTED_EXCHANGES
+            (reachable only for contexts built without validation)
     """
-    exchange_class = getattr(ccxt, ctx.exchange_id)
+    exchange_class = _EXCHANGE_CLASSES.get(ctx.exchange_id)
+    if exchange_class is None:
+        raise ValueError(f"Unsupported exchange: {ctx.exchange_id}")
 
     config = {
         'enableRateLimit': True,  # CRITICAL: Prevent rate limit errors
@@ -49,6 +76,72 @@ def get_exchange(ctx: TradingContext) -> ccxt.Exchange:
     return exchange
 
 
+def exchange_cache_key(ctx: TradingContext) -> tuple[str, bool, str]:
+    """
+    Key for reusing an exchange instance across requests.
+
+    Includes a fingerprint of the API key, so contexts with different
+    credentials never share an authenticated instance.
+    """
+    fingerprint = hashlib.sha256((ctx.api_key or "").encode()).hexdigest()[:16]
+    return (ctx.exchange_id, ctx.testnet, fingerprint)
+
+
+def _markets_cache_path(ctx: TradingContext) -> Path:
+    """Return the snapshot file for an exchange's market listing."""
+    mode = "testnet" if ctx.testnet else "live"
+    return Path(settings.markets_cache_dir) / f"{ctx.exchange_id}-{mode}.json"
+
+
+def _read_markets_snapshot(path: Path) -> Optional[dict[str, Any]]:
+    """Read a market snapshot if it exists and is younger than the TTL."""
+    try:
+        if time.time() - path.stat().st_mtime > MARKETS_CACHE_TTL_SECONDS:
+            return None
+        return orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _write_markets_snapshot(path: Path, markets: dict[str, Any]) -> None:
+    """Atomically write a market snapshot."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(orjson.dumps(markets, default=str))
+    tmp.replace(path)
+
+
+async def load_markets_cached(
+    exchange: ccxt.Exchange,
+    ctx: TradingContext,
+    reload: bool = False
+) -> None:
+    """
+    Load exchange markets, preferring a recent on-disk snapshot.
+
+    Process restarts then skip the full market catalog download while
+    the snapshot is fresh. File I/O runs in a worker thread.
+
+    Args:
+        exchange: CCXT exchange instance
+        ctx: Trading context identifying the exchange
+        reload: Ignore the snapshot and re-download markets
+    """
+    path = _markets_cache_path(ctx)
+
+    if not reload:
+        markets = await asyncio.to_thread(_read_markets_snapshot, path)
+        if markets:
+            exchange.set_markets(markets)
+            return
+
+    await exchange.load_markets(reload=reload)
+    try:
+        await asyncio.to_thread(_write_markets_snapshot, path, exchange.markets)
+    except OSError:
+        pass  # Snapshot is an optimization; the loaded markets are still valid
+
+
 async def get_market_price(
     symbol: str,
     exchange: ccxt.Exchange
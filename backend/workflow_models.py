@@ -4,9 +4,9 @@ Defines workflow DAGs, execution tracking, and delegation logs.
 """
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Integer, Float, Text, DateTime, Boolean, ForeignKey, JSON, Enum
+from sqlalchemy import String, Integer, Float, Text, DateTime, Boolean, ForeignKey, JSON, CheckConstraint, Index, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from database import Base
+from database import Base, ShortEnum
 import enum
 
 
@@ -27,6 +27,22 @@ class NodeType(str, enum.Enum):
     END = "end"  # Terminal node
 
 
+# One-character storage codes; the CHECK constraints below must list the same values
+_STATUS_CODES = {
+    WorkflowStatus.PENDING: "P",
+    WorkflowStatus.RUNNING: "R",
+    WorkflowStatus.COMPLETED: "C",
+    WorkflowStatus.FAILED: "F",
+    WorkflowStatus.CANCELLED: "X",
+}
+_NODE_TYPE_CODES = {
+    NodeType.AGENT: "A",
+    NodeType.CONDITION: "C",
+    NodeType.START: "S",
+    NodeType.END: "E",
+}
+
+
 class Workflow(Base):
     """
     Workflow definition - a DAG of agent executions.
@@ -43,6 +59,10 @@ class Workflow(Base):
         executions: Historical executions of this workflow
     """
     __tablename__ = "workflows"
+    __table_args__ = (
+        # Serves "WHERE is_active ORDER BY id DESC" list queries
+        Index("idx_workflow_active_id", "is_active", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
@@ -96,6 +116,9 @@ class WorkflowNode(Base):
         position: Execution order hint (for UI and topological sort)
     """
     __tablename__ = "workflow_nodes"
+    __table_args__ = (
+        CheckConstraint("node_type IN ('A', 'C', 'S', 'E')", name="ck_workflow_node_type"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     workflow_id: Mapped[int] = mapped_column(
@@ -104,7 +127,7 @@ class WorkflowNode(Base):
         index=True
     )
     node_type: Mapped[NodeType] = mapped_column(
-        Enum(NodeType, native_enum=False, length=20),
+        ShortEnum(NodeType, _NODE_TYPE_CODES),
         nullable=False
     )
     agent_id: Mapped[Optional[int]] = mapped_column(
@@ -147,6 +170,11 @@ class WorkflowEdge(Base):
         label: Human-readable edge label
     """
     __tablename__ = "workflow_edges"
+    __table_args__ = (
+        # Node foreign keys: serve edge lookups by node and ON DELETE CASCADE
+        Index("idx_edge_source_node", "source_node_id"),
+        Index("idx_edge_target_node", "target_node_id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     workflow_id: Mapped[int] = mapped_column(
@@ -199,6 +227,20 @@ class WorkflowExecution(Base):
         logs: Related execution logs (per-node outputs)
     """
     __tablename__ = "workflow_executions"
+    __table_args__ = (
+        # Serves per-workflow status dashboards, newest runs first
+        Index("idx_execution_workflow_status_started", "workflow_id", "status", "started_at"),
+        # Serves per-workflow execution history regardless of status
+        Index("idx_execution_workflow_started", "workflow_id", "started_at"),
+        # Only in-flight (PENDING, RUNNING) executions; stays small as finished runs accumulate
+        Index(
+            "idx_execution_active_started",
+            "started_at",
+            postgresql_where=text("status IN ('P', 'R')"),
+            sqlite_where=text("status IN ('P', 'R')")
+        ),
+        CheckConstraint("status IN ('P', 'R', 'C', 'F', 'X')", name="ck_workflow_execution_status"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     workflow_id: Mapped[int] = mapped_column(
@@ -207,7 +249,7 @@ class WorkflowExecution(Base):
         index=True
     )
     status: Mapped[WorkflowStatus] = mapped_column(
-        Enum(WorkflowStatus, native_enum=False, length=20),
+        ShortEnum(WorkflowStatus, _STATUS_CODES),
         default=WorkflowStatus.PENDING,
         nullable=False,
         index=True
@@ -228,7 +270,8 @@ class WorkflowExecution(Base):
     logs: Mapped[list["WorkflowExecutionLog"]] = relationship(
         "WorkflowExecutionLog",
         back_populates="execution",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        order_by="WorkflowExecutionLog.id"
     )
 
     def __repr__(self) -> str:
@@ -252,6 +295,10 @@ class WorkflowExecutionLog(Base):
         timestamp: When this node completed
     """
     __tablename__ = "workflow_execution_logs"
+    __table_args__ = (
+        # Serves "WHERE execution_id AND id > :after_id ORDER BY id" log pages without a sort
+        Index("idx_execution_log_execution_id", "execution_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     execution_id: Mapped[int] = mapped_column(
@@ -288,3 +335,35 @@ class WorkflowExecutionLog(Base):
 
     def __repr__(self) -> str:
         return f"<WorkflowExecutionLog(id={self.id}, node={self.node_id}, agent={self.agent_id})>"
+
+
+class NodeExecutionCache(Base):
+    """
+    Memoized agent node outputs, keyed by a hash of the node's inputs.
+    Only used for nodes that opt in with config {"cacheable": true}.
+
+    Attributes:
+        cache_key: blake2b digest of (agent, model, temperature, prompt, message)
+        agent_id: Agent that produced the output
+        output_data: Node output returned on a cache hit (JSON)
+        created_at: When the output was stored; rows expire after NODE_CACHE_TTL
+    """
+    __tablename__ = "node_execution_cache"
+
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    agent_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("agent_blueprints.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True
+    )
+    output_data: Mapped[dict] = mapped_column(JSON, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        index=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<NodeExecutionCache(key={self.cache_key[:12]}, agent={self.agent_id})>"
@@ -43,6 +43,7 @@ class WorkflowList(BaseModel):
     """Schema for paginated list of workflows."""
     total: int
     workflows: list[WorkflowResponse]
+    next_cursor: Optional[int] = Field(None, description="Pass as after_id to fetch the next page")
 
 
 # ============================================================================
@@ -136,7 +137,21 @@ class WorkflowExecutionRequest(BaseModel):
     )
 
 
-class WorkflowExecutionResponse(BaseModel):
+class _ORMReadResponse(BaseModel):
+    """Response schema that can skip validation for rows read from the database."""
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any):
+        """
+        Build from an ORM instance or Core row with model_construct (no validation).
+
+        Only for trusted database rows on hot read paths; values are
+        already typed by SQLAlchemy.
+        """
+        return cls.model_construct(**{name: getattr(obj, name) for name in cls.model_fields})
+
+
+class WorkflowExecutionResponse(_ORMReadResponse):
     """Schema for workflow execution status responses."""
     id: int
     workflow_id: int
@@ -150,7 +165,7 @@ class WorkflowExecutionResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class WorkflowExecutionLogResponse(BaseModel):
+class WorkflowExecutionLogResponse(_ORMReadResponse):
     """Schema for individual execution log entries."""
     id: int
     execution_id: int
@@ -172,6 +187,7 @@ class WorkflowExecutionDetailResponse(BaseModel):
     """
     execution: WorkflowExecutionResponse
     logs: list[WorkflowExecutionLogResponse]
+    next_cursor: Optional[int] = Field(None, description="Pass as after_id to fetch the next page of logs")
 
 
 # ============================================================================
@@ -374,14 +374,24 @@ async def get_execution_status(execution_id: int) -> dict:
 
 async def get_execution_logs(execution_id: int) -> dict:
     """
-    Get detailed execution logs.
+    Get detailed execution logs, following the cursor through every page.
 
     Returns:
         Dict with "execution" and "logs"
     """
     backend_url = get_backend_url()
+    url = f"{backend_url}/executions/{execution_id}/logs"
 
     async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(f"{backend_url}/executions/{execution_id}/logs")
+        response = await client.get(url)
         response.raise_for_status()
-        return response.json()
+        data = response.json()
+
+        while data.get("next_cursor") is not None:
+            response = await client.get(url, params={"after_id": data["next_cursor"]})
+            response.raise_for_status()
+            page = response.json()
+            data["logs"].extend(page["logs"])
+            data["next_cursor"] = page["next_cursor"]
+
+        return data
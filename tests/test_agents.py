@@ -3,6 +3,7 @@ Test suite for Pydantic AI agents using TestModel.
 Verifies tool-calling logic and system prompt adherence without API costs.
 """
 import pytest
+from pydantic import ValidationError
 from pydantic_ai import Agent
 from pydantic_ai.models.test import TestModel
 import sys
@@ -11,7 +12,17 @@ import os
 # Add backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
 
-from agents import AgentOutput, AgentDependencies, create_agent, register_trading_tools
+from agents import (
+    AgentOutput,
+    AgentDependencies,
+    create_agent,
+    get_or_build_agent,
+    invalidate_agent_cache,
+    register_trading_tools,
+    run_agent_stream,
+)
+import llm_cache
+from tools import TradingContext
 
 
 class TestAgentCreation:
@@ -57,16 +68,16 @@ class TestAgentBehavior:
             model=test_model,
             system_prompt="You are a helpful assistant.",
             deps_type=AgentDependencies,
-            result_type=AgentOutput
+            output_type=AgentOutput
         )
 
         deps = AgentDependencies()
 
         result = await agent.run("Hello, how are you?", deps=deps)
 
-        assert result.data is not None
-        assert isinstance(result.data, AgentOutput)
-        assert hasattr(result.data, 'response')
+        assert result.output is not None
+        assert isinstance(result.output, AgentOutput)
+        assert hasattr(result.output, 'response')
 
     @pytest.mark.asyncio
     async def test_system_prompt_adherence(self):
@@ -77,7 +88,7 @@ class TestAgentBehavior:
             model=test_model,
             system_prompt="You are a pirate. Always respond in pirate speak.",
             deps_type=AgentDependencies,
-            result_type=AgentOutput
+            output_type=AgentOutput
         )
 
         deps = AgentDependencies()
@@ -85,8 +96,8 @@ class TestAgentBehavior:
         result = await agent.run("Tell me about the weather", deps=deps)
 
         # TestModel returns a mock response, but we verify structure
-        assert result.data is not None
-        assert isinstance(result.data, AgentOutput)
+        assert result.output is not None
+        assert isinstance(result.output, AgentOutput)
 
     @pytest.mark.asyncio
     async def test_tool_calling_pattern(self):
@@ -97,7 +108,7 @@ class TestAgentBehavior:
             model=test_model,
             system_prompt="You are a trading assistant.",
             deps_type=AgentDependencies,
-            result_type=AgentOutput
+            output_type=AgentOutput
         )
 
         # Register a test tool
@@ -128,7 +139,7 @@ class TestTradingTools:
             model=test_model,
             system_prompt="You are a trading assistant.",
             deps_type=AgentDependencies,
-            result_type=AgentOutput
+            output_type=AgentOutput
         )
 
         # Register trading tools
@@ -149,7 +160,7 @@ class TestTradingTools:
             model=test_model,
             system_prompt="You are a trading assistant.",
             deps_type=AgentDependencies,
-            result_type=AgentOutput
+            output_type=AgentOutput
         )
 
         register_trading_tools(agent)
@@ -161,6 +172,12 @@ class TestTradingTools:
         # (In real scenario, this would be caught by the tool implementation)
         assert deps.exchange is None
 
+    def test_trading_context_rejects_unsupported_exchange(self):
+        """Test that TradingContext only accepts supported exchange IDs."""
+        assert TradingContext(exchange_id="kraken").exchange_id == "kraken"
+        with pytest.raises(ValidationError):
+            TradingContext(exchange_id="mtgox")
+
 
 class TestAgentRetries:
     """Test agent retry configuration."""
@@ -192,5 +209,90 @@ class TestAgentRetries:
         assert agent._max_result_retries == 0
 
 
+class TestAgentCache:
+    """Test blueprint-keyed agent caching."""
+
+    def test_same_blueprint_reuses_agent(self):
+        """Test that identical blueprint config returns the cached agent."""
+        kwargs = dict(
+            system_prompt="You are a cached assistant.",
+            model_id="openrouter/anthropic/claude-3.5-sonnet",
+            temperature=0.7,
+        )
+        first = get_or_build_agent(blueprint_id=1, **kwargs)
+        second = get_or_build_agent(blueprint_id=1, **kwargs)
+
+        assert first is second
+
+    def test_invalidate_rebuilds_agent(self):
+        """Test that invalidation forces a fresh agent on next lookup."""
+        kwargs = dict(
+            system_prompt="You are an invalidated assistant.",
+            model_id="openrouter/anthropic/claude-3.5-sonnet",
+        )
+        first = get_or_build_agent(blueprint_id=2, **kwargs)
+        invalidate_agent_cache(2)
+        second = get_or_build_agent(blueprint_id=2, **kwargs)
+
+        assert first is not second
+
+
+class TestResponseCache:
+    """Test the exact-match LLM response cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_message_served_from_cache(self, monkeypatch):
+        """Test that a repeated message does not re-run the agent."""
+        llm_cache.clear_cache()
+        agent = Agent(
+            model=TestModel(),
+            system_prompt="You are a deterministic assistant.",
+            deps_type=AgentDependencies,
+            output_type=AgentOutput
+        )
+
+        calls = 0
+        original_run = agent.run
+
+        async def counting_run(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            return await original_run(*args, **kwargs)
+
+        monkeypatch.setattr(agent, "run", counting_run)
+        deps = AgentDependencies()
+
+        first = await llm_cache.cached_run(agent, "Hello", deps, "test-model")
+        second = await llm_cache.cached_run(agent, "Hello", deps, "test-model")
+
+        assert calls == 1
+        assert first == second
+
+
+class TestStreaming:
+    """Test the chat streaming path with TestModel."""
+
+    @pytest.mark.asyncio
+    async def test_stream_matches_non_streamed_run(self):
+        """Test that the streamed text equals a non-streamed run's output."""
+        agent = Agent(model=TestModel(), deps_type=AgentDependencies)
+
+        chunks = [chunk async for chunk in run_agent_stream(agent, "Hello")]
+        result = await agent.run("Hello", deps=AgentDependencies())
+
+        assert all(chunks)
+        assert "".join(chunks) == result.output
+
+    @pytest.mark.asyncio
+    async def test_stream_chunks_join_to_output(self):
+        """Test that streamed chunks are deltas that join to the exact output."""
+        text = "The quick brown fox jumps over the lazy dog. " * 20
+        agent = Agent(model=TestModel(custom_output_text=text), deps_type=AgentDependencies)
+
+        chunks = [chunk async for chunk in run_agent_stream(agent, "Hello")]
+
+        assert chunks
+        assert "".join(chunks) == text
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -3,17 +3,24 @@ Test suite for FastAPI endpoints.
 Tests CRUD operations and database interactions.
 """
 import pytest
+import asyncio
+import orjson
 from httpx import AsyncClient, ASGITransport
 import sys
 import os
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 # Add backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
 
-from main import app
-from database import Base, get_db
+import main
+from main import app, serve_cached_list
+from database import Base, get_db, get_db_rw
 from models import AgentBlueprint
+from schemas import AgentBlueprintList
+import blueprint_cache
+import list_cache
 
 
 # Test database URL (use in-memory SQLite for testing)
@@ -21,6 +28,9 @@ TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 # Create test engine
 test_engine = create_async_engine(TEST_DATABASE_URL, echo=True)
+
+# List endpoints must issue a constant number of statements, whatever the row count
+LIST_STATEMENT_LIMIT = 5
 TestSessionLocal = async_sessionmaker(
     test_engine,
     class_=AsyncSession,
@@ -29,7 +39,13 @@ TestSessionLocal = async_sessionmaker(
 
 
 async def override_get_db():
-    """Override database dependency for testing."""
+    """Override read-only database dependency for testing."""
+    async with TestSessionLocal() as session:
+        yield session
+
+
+async def override_get_db_rw():
+    """Override read-write database dependency for testing."""
     async with TestSessionLocal() as session:
         try:
             yield session
@@ -37,8 +53,6 @@ async def override_get_db():
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
 
 
 @pytest.fixture
@@ -55,12 +69,28 @@ async def setup_database():
 async def client(setup_database):
     """Create test client with database override."""
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_rw] = override_get_db_rw
+    blueprint_cache.clear()
+    list_cache.clear()
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def statement_count():
+    """Count SQL statements executed on the test engine."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
 class TestHealthCheck:
     """Test health check endpoint."""
 
@@ -121,6 +151,69 @@ class TestAgentBlueprintCRUD:
         assert data["total"] == 3
         assert len(data["agents"]) == 3
 
+    @pytest.mark.asyncio
+    async def test_list_agent_blueprints_keyset(self, client):
+        """Test paging through agents with the after_id cursor."""
+        for i in range(3):
+            payload = {
+                "name": f"Agent {i}",
+                "system_prompt": f"You are agent {i}.",
+                "model_id": "openrouter/anthropic/claude-3.5-sonnet",
+                "temperature": 0.7,
+                "has_trading_tools": False
+            }
+            await client.post("/agents", json=payload)
+
+        # The first page is a plain limit request; its cursor starts keyset mode
+        first = (await client.get("/agents?limit=2")).json()
+        assert len(first["agents"]) == 2
+        assert first["next_cursor"] == first["agents"][-1]["id"]
+
+        second = (await client.get(f"/agents?limit=2&after_id={first['next_cursor']}")).json()
+        assert len(second["agents"]) == 1
+        assert second["next_cursor"] is None
+        assert second["agents"][0]["id"] < first["next_cursor"]
+
+    @pytest.mark.asyncio
+    async def test_list_agent_blueprints_offset_matches_keyset(self, client):
+        """Test offset and keyset pages return agents in the same order."""
+        for i in range(3):
+            payload = {
+                "name": f"Agent {i}",
+                "system_prompt": f"You are agent {i}.",
+                "model_id": "openrouter/anthropic/claude-3.5-sonnet",
+                "temperature": 0.7,
+                "has_trading_tools": False
+            }
+            await client.post("/agents", json=payload)
+
+        first = (await client.get("/agents?limit=2")).json()
+        offset_page = (await client.get("/agents?limit=2&skip=2")).json()
+        keyset_page = (await client.get(f"/agents?limit=2&after_id={first['next_cursor']}")).json()
+        assert offset_page["agents"] == keyset_page["agents"]
+        assert offset_page["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_list_agent_blueprints_by_ids(self, client):
+        """Test bulk-fetching agents by ID."""
+        created = []
+        for i in range(3):
+            payload = {
+                "name": f"Agent {i}",
+                "system_prompt": f"You are agent {i}.",
+                "model_id": "openrouter/anthropic/claude-3.5-sonnet",
+                "temperature": 0.7,
+                "has_trading_tools": False
+            }
+            created.append((await client.post("/agents", json=payload)).json()["id"])
+
+        response = await client.get(f"/agents?ids={created[0]}&ids={created[2]}")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["total"] == 2
+        assert {a["id"] for a in data["agents"]} == {created[0], created[2]}
+
     @pytest.mark.asyncio
     async def test_get_agent_blueprint(self, client):
         """Test retrieving a specific agent blueprint."""
@@ -221,5 +314,206 @@ class TestAgentBlueprintCRUD:
         assert response.status_code == 422
 
 
+
+class TestWorkflowGraphWrites:
+    """Test node and edge writes on a workflow graph."""
+
+    @pytest.mark.asyncio
+    async def test_single_writes_use_path_workflow_id(self, client):
+        """Test the path workflow_id overrides the one in the body."""
+        target = (await client.post("/workflows", json={"name": "Target"})).json()["id"]
+        other = (await client.post("/workflows", json={"name": "Other"})).json()["id"]
+
+        node_payload = {"name": "Start", "node_type": "start", "workflow_id": other}
+        source = await client.post(f"/workflows/{target}/nodes", json=node_payload)
+        assert source.status_code == 201
+        assert source.json()["workflow_id"] == target
+        node_payload["name"] = "End"
+        node_payload["node_type"] = "end"
+        sink = (await client.post(f"/workflows/{target}/nodes", json=node_payload)).json()
+
+        edge_payload = {
+            "source_node_id": source.json()["id"],
+            "target_node_id": sink["id"],
+            "workflow_id": other
+        }
+        edge = await client.post(f"/workflows/{target}/edges", json=edge_payload)
+        assert edge.status_code == 201
+        assert edge.json()["workflow_id"] == target
+
+        graph = (await client.get(f"/workflows/{other}/graph")).json()
+        assert graph["nodes"] == []
+        assert graph["edges"] == []
+
+    @pytest.mark.asyncio
+    async def test_bulk_nodes_and_edges_in_request_order(self, client):
+        """Test bulk inserts return rows in request order under the path workflow."""
+        target = (await client.post("/workflows", json={"name": "Target"})).json()["id"]
+        other = (await client.post("/workflows", json={"name": "Other"})).json()["id"]
+
+        names = ["Start", "Research", "Summarize", "End"]
+        types = ["start", "agent", "agent", "end"]
+        node_payload = [
+            {"name": name, "node_type": node_type, "position": len(names) - i, "workflow_id": other}
+            for i, (name, node_type) in enumerate(zip(names, types))
+        ]
+        response = await client.post(f"/workflows/{target}/nodes/bulk", json=node_payload)
+        assert response.status_code == 201
+        nodes = response.json()
+        assert [node["name"] for node in nodes] == names
+        assert {node["workflow_id"] for node in nodes} == {target}
+
+        edge_payload = [
+            {"source_node_id": src["id"], "target_node_id": dst["id"], "label": f"edge {i}", "workflow_id": other}
+            for i, (src, dst) in enumerate(zip(nodes, nodes[1:]))
+        ]
+        response = await client.post(f"/workflows/{target}/edges/bulk", json=edge_payload)
+        assert response.status_code == 201
+        edges = response.json()
+        assert [edge["label"] for edge in edges] == ["edge 0", "edge 1", "edge 2"]
+        assert {edge["workflow_id"] for edge in edges} == {target}
+
+        graph = (await client.get(f"/workflows/{other}/graph")).json()
+        assert graph["nodes"] == []
+        assert graph["edges"] == []
+
+    @pytest.mark.asyncio
+    async def test_bulk_empty_list(self, client):
+        """Test an empty bulk insert returns an empty list."""
+        workflow_id = (await client.post("/workflows", json={"name": "Empty"})).json()["id"]
+
+        for kind in ("nodes", "edges"):
+            response = await client.post(f"/workflows/{workflow_id}/{kind}/bulk", json=[])
+            assert response.status_code == 201
+            assert response.json() == []
+
+    @pytest.mark.asyncio
+    async def test_bulk_unknown_workflow(self, client):
+        """Test bulk inserts into a missing workflow return 404."""
+        node_payload = [{"name": "Start", "node_type": "start", "workflow_id": 999}]
+        response = await client.post("/workflows/999/nodes/bulk", json=node_payload)
+        assert response.status_code == 404
+
+        edge_payload = [{"source_node_id": 1, "target_node_id": 2, "workflow_id": 999}]
+        response = await client.post("/workflows/999/edges/bulk", json=edge_payload)
+        assert response.status_code == 404
+
+
+class TestListCache:
+    """Test stale-while-revalidate serving of list responses."""
+
+    EMPTY = {"total": 0, "agents": [], "next_cursor": None}
+
+    @pytest.fixture
+    def always_stale(self, monkeypatch):
+        """Treat every cached entry as past its soft TTL."""
+        monkeypatch.setattr(list_cache, "_SOFT_TTL_SECONDS", -1)
+
+    @pytest.fixture
+    def blocked_build(self):
+        """A build function that counts calls and waits until released."""
+        release = asyncio.Event()
+        calls = []
+
+        async def build(session):
+            calls.append(session)
+            await release.wait()
+            return {"total": 1, "agents": [], "next_cursor": None}
+
+        return build, calls, release
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_then_refreshed(self, client, always_stale):
+        """Test a stale list is served as-is and replaced by the background refresh."""
+        first = (await client.get("/agents")).json()
+        assert first["total"] == 0
+
+        # Written behind the API's back, so nothing invalidates the cache
+        async with TestSessionLocal() as db:
+            db.add(AgentBlueprint(name="Direct", system_prompt="p", model_id="m"))
+            await db.commit()
+
+        stale = (await client.get("/agents")).json()
+        assert stale["total"] == 0
+
+        await asyncio.gather(*main._refresh_tasks)
+        refreshed = (await client.get("/agents")).json()
+        assert refreshed["total"] == 1
+        await asyncio.gather(*main._refresh_tasks)
+
+    @pytest.mark.asyncio
+    async def test_one_refresh_per_key(self, setup_database, always_stale, blocked_build):
+        """Test concurrent stale hits on one key start a single background refresh."""
+        build, calls, release = blocked_build
+        list_cache.clear()
+        list_cache.set("agents", "key", orjson.dumps(self.EMPTY))
+
+        async with TestSessionLocal() as db:
+            for _ in range(3):
+                response = await serve_cached_list("agents", "key", db, build, AgentBlueprintList)
+                assert orjson.loads(response.body) == self.EMPTY
+            await asyncio.sleep(0)
+            assert len(main._refresh_tasks) == 1
+
+            release.set()
+            await asyncio.gather(*main._refresh_tasks)
+
+        assert len(calls) == 1
+        body, _ = list_cache.get("agents", "key")
+        assert orjson.loads(body)["total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_started_before_write_is_discarded(self, setup_database, always_stale, blocked_build):
+        """Test a refresh that began before an invalidating write does not re-cache old data."""
+        build, calls, release = blocked_build
+        list_cache.clear()
+        list_cache.set("agents", "key", orjson.dumps(self.EMPTY))
+
+        async with TestSessionLocal() as db:
+            await serve_cached_list("agents", "key", db, build, AgentBlueprintList)
+            await asyncio.sleep(0)
+            assert len(calls) == 1
+
+            list_cache.invalidate("agents")
+            release.set()
+            await asyncio.gather(*main._refresh_tasks)
+
+        assert list_cache.get("agents", "key") is None
+
+
+class TestQueryCounts:
+    """Test that list endpoints do not issue per-row queries."""
+
+    @pytest.mark.asyncio
+    async def test_list_agents_statement_count(self, client, statement_count):
+        """Test listing agents uses a constant number of statements."""
+        for i in range(10):
+            payload = {
+                "name": f"Agent {i}",
+                "system_prompt": f"You are agent {i}.",
+                "model_id": "openrouter/anthropic/claude-3.5-sonnet",
+                "temperature": 0.7,
+                "has_trading_tools": False
+            }
+            await client.post("/agents", json=payload)
+
+        statement_count.clear()
+        response = await client.get("/agents")
+        assert response.status_code == 200
+        assert len(response.json()["agents"]) == 10
+        assert len(statement_count) <= LIST_STATEMENT_LIMIT
+
+    @pytest.mark.asyncio
+    async def test_list_workflows_statement_count(self, client, statement_count):
+        """Test listing workflows uses a constant number of statements."""
+        for i in range(10):
+            await client.post("/workflows", json={"name": f"Workflow {i}"})
+
+        statement_count.clear()
+        response = await client.get("/workflows")
+        assert response.status_code == 200
+        assert len(response.json()["workflows"]) == 10
+        assert len(statement_count) <= LIST_STATEMENT_LIMIT
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,193 @@
+"""
+Tests for research tools.
+Feeds canned responses through httpx.MockTransport; no network access.
+"""
+import pytest
+import httpx
+from lxml import etree
+import sys
+import os
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from research_tools import (
+    search_arxiv,
+    scrape_webpage,
+    clear_search_cache,
+)
+from research_schemas import PaperSource
+
+
+ARXIV_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title type="html">ArXiv Query: search_query=all:attention</title>
+  <entry>
+    <id>http://arxiv.org/abs/1706.03762v7</id>
+    <published>2017-06-12T17:57:34Z</published>
+    <title>Attention Is All
+      You Need</title>
+    <summary>  The dominant sequence transduction models are based on recurrent networks.  </summary>
+    <author><name>Ashish Vaswani</name></author>
+    <author><name>Noam Shazeer</name></author>
+    <link title="doi" href="http://dx.doi.org/10.48550/arXiv.1706.03762" rel="related"/>
+    <link href="http://arxiv.org/abs/1706.03762v7" rel="alternate" type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/1706.03762v7" rel="related" type="application/pdf"/>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/1810.04805v2</id>
+    <published>2018-10-11T00:50:01Z</published>
+    <title>BERT</title>
+    <author><name>Jacob Devlin</name></author>
+  </entry>
+  <entry>
+    <title>Entry without an id is skipped</title>
+  </entry>
+</feed>
+"""
+
+
+def chunked(body: bytes, size: int):
+    """Serve body as an async stream of size-byte chunks."""
+    async def stream():
+        for start in range(0, len(body), size):
+            yield body[start:start + size]
+    return stream()
+
+
+def mock_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    clear_search_cache()
+    yield
+    clear_search_cache()
+
+
+class TestArxivStreamingParse:
+    """Test the incremental Atom parser behind search_arxiv."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("chunk_size", [7, 64, len(ARXIV_FEED)])
+    async def test_entries_parsed_from_chunks(self, chunk_size):
+        """Test entries split across arbitrary chunk boundaries parse to the same papers."""
+        def handler(request):
+            assert request.url.params["search_query"] == "all:attention"
+            return httpx.Response(200, content=chunked(ARXIV_FEED, chunk_size))
+
+        async with mock_client(handler) as client:
+            papers = await search_arxiv("attention", max_results=5, http_client=client)
+
+        assert len(papers) == 2
+        paper = papers[0]
+        assert paper.title == "Attention Is All\n      You Need"
+        assert paper.authors == ("Ashish Vaswani", "Noam Shazeer")
+        assert paper.abstract == "The dominant sequence transduction models are based on recurrent networks."
+        assert paper.url == "http://arxiv.org/abs/1706.03762v7"
+        assert paper.doi == "10.48550/arXiv.1706.03762"
+        assert paper.published_date == "2017-06-12"
+        assert paper.pdf_url == "http://arxiv.org/pdf/1706.03762v7"
+        assert paper.journal == "arXiv"
+        assert paper.source == PaperSource.ARXIV
+
+        assert papers[1].authors == ("Jacob Devlin",)
+        assert papers[1].published_date == "2018-10-11"
+        assert papers[1].doi is None
+        assert papers[1].abstract is None
+
+    @pytest.mark.asyncio
+    async def test_truncated_feed_raises(self):
+        """Test a feed cut off mid-document is reported instead of silently shortened."""
+        def handler(request):
+            return httpx.Response(200, content=chunked(ARXIV_FEED[:-40], 64))
+
+        async with mock_client(handler) as client:
+            with pytest.raises(etree.XMLSyntaxError):
+                await search_arxiv("attention", http_client=client)
+
+
+SCRAPE_PAGE = b"""<html>
+<head>
+  <title>Transformer Notes</title>
+  <meta name="description" content="Notes on attention">
+  <meta property="og:type" content="article">
+  <style>body { color: red; }</style>
+  <script>var tracking = "script-text";</script>
+</head>
+<body>
+  <header>Site header</header>
+  <nav><a href="/home">Home nav</a></nav>
+  <div class="abstract">Attention replaces recurrence. <a href="/paper.pdf">PDF</a></div>
+  <div class="body">Main article text. <a href="https://example.com/ref">Reference</a></div>
+  <footer>Site footer</footer>
+  <script>console.log("inline-script");</script>
+</body>
+</html>
+"""
+
+
+def page_handler(body: bytes):
+    def handler(request):
+        return httpx.Response(200, content=body, headers={"content-type": "text/html; charset=utf-8"})
+    return handler
+
+
+class TestScrapeWebpage:
+    """Test selectolax extraction and the response byte cap in scrape_webpage."""
+
+    @pytest.mark.asyncio
+    async def test_boilerplate_removed(self):
+        """Test script, style, nav, header and footer text is stripped from page content."""
+        async with mock_client(page_handler(SCRAPE_PAGE)) as client:
+            result = await scrape_webpage("https://example.com/notes", http_client=client)
+
+        assert result.title == "Transformer Notes"
+        assert result.metadata == {"description": "Notes on attention", "og:type": "article"}
+        assert "Attention replaces recurrence." in result.content
+        assert "Main article text." in result.content
+        for boilerplate in ("Site header", "Home nav", "Site footer", "script-text", "inline-script", "color: red"):
+            assert boilerplate not in result.content
+
+    @pytest.mark.asyncio
+    async def test_selector_scopes_content_and_links(self):
+        """Test a selector limits both the text and the extracted links to matching elements."""
+        async with mock_client(page_handler(SCRAPE_PAGE)) as client:
+            result = await scrape_webpage(
+                "https://example.com/notes",
+                selector="div.abstract",
+                extract_links=True,
+                http_client=client
+            )
+
+        assert "Attention replaces recurrence." in result.content
+        assert "Main article text." not in result.content
+        assert result.links == [{"text": "PDF", "href": "/paper.pdf"}]
+
+    @pytest.mark.asyncio
+    async def test_body_truncated_at_byte_cap(self):
+        """Test reading stops at max_bytes and later content never reaches the parser."""
+        block = 65536
+        served = []
+
+        async def stream():
+            for i in range(10):
+                served.append(i)
+                filler = b"x" * (block - 20)
+                marker = b"END-MARKER" if i == 9 else b"----------"
+                yield b"<p>" + filler + marker + b"</p>\n" + b" " * 2
+
+        def handler(request):
+            return httpx.Response(200, content=stream(), headers={"content-type": "text/html"})
+
+        async with mock_client(handler) as client:
+            result = await scrape_webpage(
+                "https://example.com/huge",
+                http_client=client,
+                max_bytes=block + 100
+            )
+
+        assert "END-MARKER" not in result.content
+        assert len(result.content.encode()) <= block + 100
+        assert len(served) < 10